@@ -1,8 +1,7 @@
+import asyncio
 import traceback
 import os
 import logging
-import smtplib
-from email.mime.text import MIMEText
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from fastapi import Request
@@ -38,8 +37,8 @@ EMAIL_TO = [
     if e.strip()
 ]
 
-logger.info(f"[ErrorNotifier] SMTP_SERVER: {SMTP_SERVER}")
-logger.info(f"[ErrorNotifier] EMAIL_TO: {EMAIL_TO}")
+logger.info("[ErrorNotifier] SMTP_SERVER: %s", SMTP_SERVER)
+logger.info("[ErrorNotifier] EMAIL_TO: %s", EMAIL_TO)
 # -------------------------------------------------
 # Resolve Slack user ID from email
 # -------------------------------------------------
@@ -55,11 +54,11 @@ def get_slack_user_id(email: str) -> str | None:
 
     except SlackApiError as e:
         logger.error(
-            f"[ErrorNotifier] Slack lookup failed for {email}: "
-            f"{e.response.get('error')}"
+            "[ErrorNotifier] Slack lookup failed for %s: %s",
+            email, e.response.get('error')
         )
     except Exception as e:
-        logger.error(f"[ErrorNotifier] Unexpected Slack lookup error for {email}: {e}")
+        logger.error("[ErrorNotifier] Unexpected Slack lookup error for %s: %s", email, e)
 
     return None
 
@@ -85,7 +84,7 @@ async def notify_slack(exc: Exception, request: Request):
     for email in SLACK_ALERT_EMAILS:
         user_id = get_slack_user_id(email)
         if not user_id:
-            logger.warning(f"[ErrorNotifier] Slack user not found for {email}")
+            logger.warning("[ErrorNotifier] Slack user not found for %s", email)
             continue
 
         try:
@@ -93,14 +92,14 @@ async def notify_slack(exc: Exception, request: Request):
                 channel=user_id,
                 text=message
             )
-            logger.info(f"[ErrorNotifier] Slack alert sent to {email} ({user_id})")
+            logger.info("[ErrorNotifier] Slack alert sent to %s (%s)", email, user_id)
         except SlackApiError as e:
             logger.error(
-                f"[ErrorNotifier] Slack DM failed for {email}: "
-                f"{e.response.get('error')}"
+                "[ErrorNotifier] Slack DM failed for %s: %s",
+                email, e.response.get('error')
             )
         except Exception as e:
-            logger.error(f"[ErrorNotifier] Unexpected Slack DM error: {e}")
+            logger.error("[ErrorNotifier] Unexpected Slack DM error: %s", e)
 
 
 # -------------------------------------------------
@@ -111,7 +110,14 @@ def notify_email(exc: Exception, request: Request):
         logger.warning("[ErrorNotifier] SMTP not configured; skipping email alert")
         return
 
-    tb = traceback.format_exc()
+    # Imported on first alert: most processes never send one, and smtplib and
+    # the email package pull in ssl, base64, quopri and friends
+    import smtplib
+    from email.message import EmailMessage
+
+    # Format from the exception itself: this runs in a worker thread, where
+    # traceback.format_exc() would not see the exception being handled
+    tb = "".join(traceback.format_exception(exc))
 
     subject = f"[BFA ALERT] Internal error on {request.url.path}"
     body = f"""
@@ -127,21 +133,19 @@ Traceback:
 {tb}
 """
 
-    msg = MIMEText(body)
+    msg = EmailMessage()
+    msg.set_content(body)
     msg["Subject"] = subject
     msg["From"] = SMTP_FROM
     msg["To"] = ", ".join(EMAIL_TO)
 
     try:
         with smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=10) as server:
-            server.sendmail(
-                SMTP_FROM,
-                EMAIL_TO,
-                msg.as_string()
-            )
+            server.send_message(msg, from_addr=SMTP_FROM, to_addrs=EMAIL_TO)
         logger.info("[ErrorNotifier] Email alert sent successfully")
-    except Exception as e:
-        logger.error(f"[ErrorNotifier] Email send failed: {e}")
+    except (smtplib.SMTPException, OSError) as e:
+        # Connection/protocol failures only; anything else surfaces in notify_global_error
+        logger.error("[ErrorNotifier] Email send failed: %s", e)
 
 
 # -------------------------------------------------
@@ -151,9 +155,10 @@ async def notify_global_error(exc: Exception, request: Request):
     try:
         await notify_slack(exc, request)
     except Exception as e:
-        logger.error(f"[ErrorNotifier] Slack notification failed: {e}")
+        logger.error("[ErrorNotifier] Slack notification failed: %s", e)
 
     try:
-        notify_email(exc, request)
+        # SMTP connect/send blocks; keep it off the event loop
+        await asyncio.to_thread(notify_email, exc, request)
     except Exception as e:
-        logger.error(f"[ErrorNotifier] Email notification failed: {e}")
\ No newline at end of file
+        logger.error("[ErrorNotifier] Email notification failed: %s", e)
\ No newline at end of file
@@ -109,7 +109,7 @@ def index_domain_patterns(context_data: Dict[str, Any], ctx_db: VectorDBClient)
                     "[RAG] Failed to add domain pattern to Chroma, skipping"
                 )
 
-    logger.info(f"[RAG] Indexed domain patterns: {total}")
+    logger.info("[RAG] Indexed domain patterns: %s", total)
 
 
 # -------------------------------
@@ -148,7 +148,7 @@ def lookup_domain_matches(
             include=["documents", "metadatas", "distances"],
         )
     except Exception as e:
-        logger.exception(f"[RAG] Domain context query failed: {e}")
+        logger.exception("[RAG] Domain context query failed: %s", e)
         return []
 
     docs = (res.get("documents") or [[]])[0] or []
@@ -65,7 +65,34 @@ def test_notify_email_sends_when_configured(mocker, request_mock, exception):
 
     notify_email(exception, request_mock)
 
-    server.sendmail.assert_called_once()
+    server.send_message.assert_called_once()
+    msg = server.send_message.call_args.args[0]
+    assert msg["To"] == "ops@example.com"
+    assert msg.get_content_type() == "text/plain"
+
+
+def test_notify_email_includes_traceback_outside_except_block(mocker, request_mock, exception):
+    mocker.patch("error_notifier.SMTP_SERVER", "localhost")
+    mocker.patch("error_notifier.EMAIL_TO", ["ops@example.com"])
+
+    smtp_mock = mocker.patch("smtplib.SMTP", autospec=True)
+    server = smtp_mock.return_value.__enter__.return_value
+
+    # notify_global_error runs this in a worker thread, with no active exception
+    notify_email(exception, request_mock)
+
+    msg = server.send_message.call_args.args[0]
+    assert "RuntimeError: Test exception" in msg.get_content()
+
+
+def test_notify_email_handles_smtp_connection_failure(mocker, request_mock, exception):
+    mocker.patch("error_notifier.SMTP_SERVER", "localhost")
+    mocker.patch("error_notifier.EMAIL_TO", ["ops@example.com"])
+
+    mocker.patch("smtplib.SMTP", side_effect=ConnectionRefusedError("refused"))
+
+    # Must not raise
+    notify_email(exception, request_mock)
 
 
 # ---------------------------------------------------------
@@ -45,9 +45,11 @@ class VectorDBClient:
             # Persistent client; path should be writable
             self.client = chromadb.PersistentClient(path=self.persist_path)
             self.collection = self.client.get_or_create_collection(name=CHROMA_COLLECTION)
-            logger.info(f"[VectorDB] Connected to Chroma collection '{CHROMA_COLLECTION}' (path={self.persist_path})")
+            logger.info(
+                "[VectorDB] Connected to Chroma collection '%s' (path=%s)", CHROMA_COLLECTION, self.persist_path
+            )
         except Exception as e:
-            logger.exception(f"[VectorDB] Failed to initialize Chroma client: {e}")
+            logger.exception("[VectorDB] Failed to initialize Chroma client: %s", e)
             raise
 
     # -----------------------
@@ -83,7 +85,7 @@ class VectorDBClient:
             logger.debug("[VectorDB] Ollama HTTP embed returned unexpected shape: %s", data)
             return None
         except Exception as e:
-            logger.debug(f"[VectorDB] Ollama HTTP embedding failed: {e}")
+            logger.debug("[VectorDB] Ollama HTTP embedding failed: %s", e)
             return None
 
     def _get_embedding_ollama_cli(self, text: str) -> Optional[List[float]]:
@@ -125,7 +127,7 @@ class VectorDBClient:
             logger.debug("[VectorDB] Ollama CLI did not produce an embedding")
             return None
         except Exception as e:
-            logger.debug(f"[VectorDB] Ollama CLI embedding failed: {e}")
+            logger.debug("[VectorDB] Ollama CLI embedding failed: %s", e)
             return None
 
     def _get_embedding(self, text: str) -> Optional[List[float]]:
@@ -187,7 +189,7 @@ class VectorDBClient:
                 include=["metadatas", "documents", "distances"],
             )
         except Exception as e:
-            logger.exception(f"[VectorDB] Query failed: {e}")
+            logger.exception("[VectorDB] Query failed: %s", e)
             return None
 
         ids = res.get("ids", [])
@@ -223,7 +225,7 @@ class VectorDBClient:
         candidates.sort(reverse=True, key=lambda x: x[0])
         best_sim, idx = candidates[0]
 
-        logger.info(f"============== Best Similarity Score: {best_sim} =============")
+        logger.info("============== Best Similarity Score: %s =============", best_sim)
 
         # Validate threshold
         if best_sim <= similarity_threshold:
@@ -328,7 +330,7 @@ def init_vector_db(persist_directory: Optional[str] = None) -> VectorDBClient:
     """
     persist_directory = persist_directory or CHROMA_DB_PATH
     client = VectorDBClient(persist_path=persist_directory)
-    logger.info(f"[VectorDB] init_vector_db() -> {persist_directory}")
+    logger.info("[VectorDB] init_vector_db() -> %s", persist_directory)
     return client
 
 
@@ -1081,10 +1081,19 @@ class ApiPoster:
             logger.error("API_POST_URL is not configured")
             return False
 
-        logger.info(
-            "Posting Jenkins build to API: %s #%s",
-            jenkins_payload['job_name'], jenkins_payload['build_number']
-        )
+        t0 = time.perf_counter_ns()
+        job_name = jenkins_payload.get('job_name', 'unknown')
+        pipeline_id = jenkins_payload.get('build_number', 0)
+        project_id = 0  # Jenkins doesn't have project_id concept
+
+        logger.info("Posting Jenkins build to API: %s #%s", job_name, pipeline_id)
+
+        # Outcome of this call, recorded once in the finally block:
+        # 'ok', 'non_2xx', 'retry_exhausted' or 'exception'
+        result = 'exception'
+        status_code = None
+        response_body = ""
+        error_msg = None
 
         try:
             # Transform Jenkins payload to match GitLab API format
@@ -1097,85 +1106,42 @@ class ApiPoster:
                     max_retries=self.config.retry_attempts,
                     base_delay=self.config.retry_delay
                 )
-
-                try:
-                    status_code, response_body, duration_ms = error_handler.retry_with_backoff(
-                        self._post_to_api,
-                        payload,
-                        exceptions=(RequestException,)
-                    )
-                except RetryExhaustedError as error:
-                    logger.error("Retry exhausted posting Jenkins logs to API: %s", error)
-
-                    # Log the payload that failed after all retries
-                    logger.error("Payload that failed after all retries:\n%s", json.dumps(payload, indent=2))
-
-                    # Extract pipeline_id and project_id from payload
-                    pipeline_id = payload.get('build_number', 0)
-                    project_id = 0  # Jenkins doesn't have project_id concept
-                    self._log_api_request(
-                        pipeline_id=pipeline_id,
-                        project_id=project_id,
-                        status_code=None,
-                        response_body=str(error),
-                        duration_ms=0,
-                        error=str(error)
-                    )
-                    return False
+                status_code, response_body, _ = error_handler.retry_with_backoff(
+                    self._post_to_api,
+                    payload,
+                    exceptions=(RequestException,)
+                )
             else:
                 # Single attempt without retry
-                status_code, response_body, duration_ms = self._post_to_api(payload)
-
-            # Log the request/response
-            # Extract pipeline_id and project_id from payload
-            pipeline_id = payload.get('build_number', 0)
-            project_id = 0  # Jenkins doesn't have project_id concept
-            self._log_api_request(
-                pipeline_id=pipeline_id,
-                project_id=project_id,
-                status_code=status_code,
-                response_body=response_body,
-                duration_ms=duration_ms
-            )
+                status_code, response_body, _ = self._post_to_api(payload)
 
             # Check if successful
             if 200 <= status_code < 300:
-                job_name = jenkins_payload['job_name']
-                build_num = jenkins_payload['build_number']
-                logger.info(
-                    "Successfully posted Jenkins build %s #%s to API",
-                    job_name, build_num,
-                    extra={
-                        'job_name': job_name,
-                        'build_number': build_num,
-                        'status_code': status_code,
-                        'duration_ms': duration_ms
-                    }
-                )
-
+                result = 'ok'
                 # Log successful payload for debugging
                 logger.debug("Payload posted successfully:\n%s", json.dumps(payload, indent=2))
-
                 return True
 
-            logger.warning(
-                "API returned non-success status code for Jenkins build: %s",
-                status_code,
-                extra={
-                    'job_name': jenkins_payload['job_name'],
-                    'build_number': jenkins_payload['build_number'],
-                    'status_code': status_code
-                }
-            )
+            result = 'non_2xx'
+            return False
+
+        except RetryExhaustedError as error:
+            result = 'retry_exhausted'
+            error_msg = str(error)
+            response_body = error_msg
+
+            # Log the payload that failed after all retries
+            logger.error("Payload that failed after all retries:\n%s", json.dumps(payload, indent=2))
             return False
 
         except Exception as error:  # pylint: disable=broad-exception-caught
+            error_msg = f"{type(error).__name__}: {str(error)}"
             logger.error(
                 "Unexpected error posting Jenkins logs to API: %s",
                 error,
                 extra={
-                    'job_name': jenkins_payload.get('job_name', 'unknown'),
-                    'build_number': jenkins_payload.get('build_number', 0),
+                    'job_name': job_name,
+                    'build_number': pipeline_id,
                     'error_type': type(error).__name__,
                     'error': str(error)
                 },
@@ -1184,19 +1150,30 @@ class ApiPoster:
 
             # Log the payload that caused the unexpected error
             logger.error("Payload that caused unexpected error:\n%s", json.dumps(jenkins_payload, indent=2))
+            return False
 
-            # Extract pipeline_id and project_id from payload
-            pipeline_id = jenkins_payload.get('build_number', 0)
-            project_id = 0  # Jenkins doesn't have project_id concept
+        finally:
+            duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
+            logger.log(
+                logging.INFO if result == 'ok' else logging.WARNING,
+                "Jenkins API POST for %s #%s finished: result=%s status_code=%s duration_ms=%s",
+                job_name, pipeline_id, result, status_code, duration_ms,
+                extra={
+                    'job_name': job_name,
+                    'build_number': pipeline_id,
+                    'result': result,
+                    'status_code': status_code,
+                    'duration_ms': duration_ms
+                }
+            )
             self._log_api_request(
                 pipeline_id=pipeline_id,
                 project_id=project_id,
-                status_code=None,
-                response_body="",
-                duration_ms=0,
-                error=f"{type(error).__name__}: {str(error)}"
+                status_code=status_code,
+                response_body=response_body,
+                duration_ms=duration_ms,
+                error=error_msg
             )
-            return False
 
 
 if __name__ == "__main__":
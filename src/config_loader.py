@@ -15,21 +15,79 @@ Invokes: None
 """
 
 import os
+import sys
 import base64
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Mapping, FrozenSet
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Accepted spellings for boolean environment variables (case-insensitive)
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
 
-@dataclass
+# Allowed LOG_LEVEL values
+_VALID_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+
+# Default (threshold, lines_before, lines_after) buckets for adaptive error context.
+# Must stay equal to parsing _DEFAULT_ADAPTIVE_THRESHOLDS_STR (asserted in tests).
+_DEFAULT_ADAPTIVE_THRESHOLDS_STR = '50:50:10,100:10:5,150:5:2'
+_DEFAULT_ADAPTIVE_THRESHOLDS = ((50, 50, 10), (100, 10, 5), (150, 5, 2))
+
+# BFA analysis endpoint built from BFA_HOST
+_BFA_URL_FMT = "http://{}:8000/api/analyze".format
+
+
+def _is_http_url(url: str) -> bool:
+    """Return True if `url` starts with http:// or https:// (slice compares, no tuple or regex)."""
+    return url[:7] == 'http://' or url[:8] == 'https://'
+
+
+def _envbool(env: Mapping[str, str], name: str, default: str) -> bool:
+    """Return True if variable `name` in `env` (or `default`) is a truthy string."""
+    return env.get(name, default).strip().lower() in _TRUTHY
+
+
+def _envint(
+    env: Mapping[str, str], name: str, default: str,
+    lo: Optional[int] = None, hi: Optional[int] = None
+) -> int:
+    """
+    Parse integer variable `name` in `env` (or `default`) and check it against [lo, hi].
+
+    Raises:
+        ValueError: If the value is not an integer or falls outside the range, naming the variable
+    """
+    raw = env.get(name, default)
+    try:
+        value = int(raw)
+    except ValueError as error:
+        raise ValueError(f"Invalid {name}: {raw!r}. Must be an integer") from error
+    if lo is not None and hi is not None and not lo <= value <= hi:
+        raise ValueError(f"Invalid {name}: {value}. Must be between {lo} and {hi}")
+    return value
+
+
+def _csv(env: Mapping[str, str], name: str, default: str = '', lower: bool = False) -> Tuple[str, ...]:
+    """Split comma-separated variable `name` in `env` into stripped, non-empty, interned items."""
+    raw = env.get(name, default).strip()
+    if not raw:
+        return ()
+    if lower:
+        raw = raw.lower()
+    return tuple(sys.intern(t) for t in (s.strip() for s in raw.split(',')) if t)
+
+
+@dataclass(frozen=True)
 class Config:  # pylint: disable=too-many-instance-attributes
     """
     Configuration data class holding all application settings.
 
     @dataclass: Python decorator that auto-generates __init__(), __repr__(), and __eq__() methods
                 from class attributes, eliminating boilerplate code for data classes.
+    frozen=True: Instances are read-only after load; use dataclasses.replace() to derive
+                 a modified copy. Collection fields are stored as frozensets/tuples so a loaded Config
+                 is hashable and can key caches in downstream modules.
 
     Attributes:
         gitlab_url                       -> (str)           -> GitLab instance URL
@@ -40,10 +98,10 @@ class Config:  # pylint: disable=too-many-instance-attributes
         retry_attempts                   -> (int)           -> API retry attempts
         retry_delay                      -> (int)           -> Retry delay (seconds)
         log_level                        -> (str)           -> Logging level
-        log_save_pipeline_status         -> (List[str])     -> Pipeline statuses to save
-        log_save_projects                -> (List[str])     -> Project IDs whitelist
-        log_exclude_projects             -> (List[str])     -> Project IDs blacklist
-        log_save_job_status              -> (List[str])     -> Job statuses to save
+        log_save_pipeline_status         -> (FrozenSet[str]) -> Pipeline statuses to save ('all' = no filter)
+        log_save_projects                -> (FrozenSet[str]) -> Project IDs whitelist
+        log_exclude_projects             -> (FrozenSet[str]) -> Project IDs blacklist
+        log_save_job_status              -> (FrozenSet[str]) -> Job statuses to save ('all' = no filter)
         log_save_metadata_always         -> (bool)          -> Save metadata always
         api_post_enabled                 -> (bool)          -> Enable API posting
         api_post_url                     -> (Optional[str]) -> API endpoint URL
@@ -60,7 +118,7 @@ class Config:  # pylint: disable=too-many-instance-attributes
         error_context_lines_before       -> (int)           -> Error context lines before
         error_context_lines_after        -> (int)           -> Error context lines after
         error_adaptive_context_enabled   -> (bool)          -> Enable adaptive context
-        error_adaptive_thresholds        -> (List[Tuple])   -> Adaptive thresholds (threshold, before, after)
+        error_adaptive_thresholds        -> (Tuple[Tuple])  -> Adaptive thresholds (threshold, before, after)
         max_log_lines                    -> (int)           -> Max lines to process per log
         tail_log_lines                   -> (int)           -> Lines to fetch from tail first
         stream_chunk_size                -> (int)           -> Bytes per chunk when streaming
@@ -74,10 +132,10 @@ class Config:  # pylint: disable=too-many-instance-attributes
     retry_attempts: int
     retry_delay: int
     log_level: str
-    log_save_pipeline_status: List[str]
-    log_save_projects: List[str]
-    log_exclude_projects: List[str]
-    log_save_job_status: List[str]
+    log_save_pipeline_status: FrozenSet[str]
+    log_save_projects: FrozenSet[str]
+    log_exclude_projects: FrozenSet[str]
+    log_save_job_status: FrozenSet[str]
     log_save_metadata_always: bool
     api_post_enabled: bool
     api_post_url: Optional[str]  # Auto-constructed from BFA_HOST
@@ -94,13 +152,17 @@ class Config:  # pylint: disable=too-many-instance-attributes
     error_context_lines_before: int
     error_context_lines_after: int
     error_adaptive_context_enabled: bool
-    error_adaptive_thresholds: List[Tuple[int, int, int]]
+    error_adaptive_thresholds: Tuple[Tuple[int, int, int], ...]
     max_log_lines: int
     tail_log_lines: int
     stream_chunk_size: int
     jenkins_filter_handled_failures: bool = field(default=True)
 
 
+# Process-wide cache of the parsed configuration (populated by ConfigLoader.load())
+_cached_config: Optional[Config] = None
+
+
 class ConfigLoader:
     """
     Configuration loader and validator.
@@ -110,10 +172,13 @@ class ConfigLoader:
     Usage:
         config = ConfigLoader.load()
         print(config.gitlab_url)
+
+    The parsed configuration is cached per process; call ConfigLoader.reload()
+    to re-read the environment (e.g. in tests that modify environment variables).
     """
 
     @staticmethod
-    def _decode_if_base64(env_var_name: str, value: str) -> str:
+    def _decode_if_base64(env_var_name: str, value: str, env: Optional[Mapping[str, str]] = None) -> str:
         """
         Decode environment variable value if it's base64 encoded.
 
@@ -123,11 +188,13 @@ class ConfigLoader:
         Args:
             env_var_name: Name of the environment variable
             value: The value to potentially decode
+            env: Environment mapping to read the _ENCODING flag from (defaults to os.environ)
 
         Returns:
             Decoded value if base64, original value otherwise
         """
-        encoding_type = os.getenv(f'{env_var_name}_ENCODING', 'plain').lower()
+        env = os.environ if env is None else env
+        encoding_type = env.get(f'{env_var_name}_ENCODING', 'plain').lower()
 
         if encoding_type == 'base64':
             try:
@@ -143,14 +210,15 @@ class ConfigLoader:
         return value
 
     @staticmethod
-    def _load_basic_settings() -> Dict[str, Any]:
+    def _load_basic_settings(env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """Load basic webhook and logging settings."""
-        webhook_port = int(os.getenv('WEBHOOK_PORT', '8000'))
-        webhook_secret = os.getenv('WEBHOOK_SECRET')
-        log_output_dir = os.getenv('LOG_OUTPUT_DIR', './logs/pipeline-logs')
-        retry_attempts = int(os.getenv('RETRY_ATTEMPTS', '3'))
-        retry_delay = int(os.getenv('RETRY_DELAY', '2'))
-        log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+        env = os.environ if env is None else env
+        webhook_port = _envint(env, 'WEBHOOK_PORT', '8000', 1, 65535)
+        webhook_secret = env.get('WEBHOOK_SECRET')
+        log_output_dir = env.get('LOG_OUTPUT_DIR', './logs/pipeline-logs')
+        retry_attempts = _envint(env, 'RETRY_ATTEMPTS', '3')
+        retry_delay = _envint(env, 'RETRY_DELAY', '2')
+        log_level = sys.intern(env.get('LOG_LEVEL', 'INFO').upper())
 
         return {
             'webhook_port': webhook_port,
@@ -162,26 +230,14 @@ class ConfigLoader:
         }
 
     @staticmethod
-    def _load_log_filtering() -> Dict[str, Any]:
-        """Load log filtering configuration."""
-        log_save_pipeline_status_str = os.getenv('LOG_SAVE_PIPELINE_STATUS', 'all')
-        log_save_pipeline_status = [
-            s.strip().lower() for s in log_save_pipeline_status_str.split(',') if s.strip()
-        ]
-
-        log_save_projects_str = os.getenv('LOG_SAVE_PROJECTS', '')
-        log_save_projects = [s.strip() for s in log_save_projects_str.split(',') if s.strip()]
-
-        log_exclude_projects_str = os.getenv('LOG_EXCLUDE_PROJECTS', '')
-        log_exclude_projects = [s.strip() for s in log_exclude_projects_str.split(',') if s.strip()]
-
-        log_save_job_status_str = os.getenv('LOG_SAVE_JOB_STATUS', 'all')
-        log_save_job_status = [
-            s.strip().lower() for s in log_save_job_status_str.split(',') if s.strip()
-        ]
-
-        log_save_metadata_always_str = os.getenv('LOG_SAVE_METADATA_ALWAYS', 'true').lower()
-        log_save_metadata_always = log_save_metadata_always_str in ['true', '1', 'yes', 'on']
+    def _load_log_filtering(env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+        """Load log filtering configuration (stored as frozensets for O(1) membership checks)."""
+        env = os.environ if env is None else env
+        log_save_pipeline_status = frozenset(_csv(env, 'LOG_SAVE_PIPELINE_STATUS', 'all', lower=True))
+        log_save_projects = frozenset(_csv(env, 'LOG_SAVE_PROJECTS'))
+        log_exclude_projects = frozenset(_csv(env, 'LOG_EXCLUDE_PROJECTS'))
+        log_save_job_status = frozenset(_csv(env, 'LOG_SAVE_JOB_STATUS', 'all', lower=True))
+        log_save_metadata_always = _envbool(env, 'LOG_SAVE_METADATA_ALWAYS', 'true')
 
         return {
             'log_save_pipeline_status': log_save_pipeline_status,
@@ -192,18 +248,15 @@ class ConfigLoader:
         }
 
     @staticmethod
-    def _load_api_config() -> Dict[str, Any]:
+    def _load_api_config(env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """Load API POST configuration."""
-        api_post_enabled_str = os.getenv('API_POST_ENABLED', 'false').lower()
-        api_post_enabled = api_post_enabled_str in ['true', '1', 'yes', 'on']
-
-        api_post_timeout = int(os.getenv('API_POST_TIMEOUT', '30'))
-
-        api_post_retry_enabled_str = os.getenv('API_POST_RETRY_ENABLED', 'true').lower()
-        api_post_retry_enabled = api_post_retry_enabled_str in ['true', '1', 'yes', 'on']
-
-        api_post_save_to_file_str = os.getenv('API_POST_SAVE_TO_FILE', 'false').lower()
-        api_post_save_to_file = api_post_save_to_file_str in ['true', '1', 'yes', 'on']
+        env = os.environ if env is None else env
+        api_post_enabled = _envbool(env, 'API_POST_ENABLED', 'false')
+        # Timeout range (seconds) only matters when posting is enabled
+        lo, hi = (1, 300) if api_post_enabled else (None, None)
+        api_post_timeout = _envint(env, 'API_POST_TIMEOUT', '30', lo, hi)
+        api_post_retry_enabled = _envbool(env, 'API_POST_RETRY_ENABLED', 'true')
+        api_post_save_to_file = _envbool(env, 'API_POST_SAVE_TO_FILE', 'false')
 
         return {
             'api_post_enabled': api_post_enabled,
@@ -213,30 +266,34 @@ class ConfigLoader:
         }
 
     @staticmethod
-    def _load_jenkins_config() -> Dict[str, Any]:
+    def _load_jenkins_config(env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """Load Jenkins configuration."""
-        jenkins_enabled_str = os.getenv('JENKINS_ENABLED', 'false').lower()
-        jenkins_enabled = jenkins_enabled_str in ['true', '1', 'yes', 'on']
-
-        jenkins_url = os.getenv('JENKINS_URL')
-        if jenkins_url:
-            jenkins_url = jenkins_url.rstrip('/')
-
-        jenkins_user = os.getenv('JENKINS_USER')
-
-        # Decode API token if base64 encoded
-        jenkins_api_token = os.getenv('JENKINS_API_TOKEN')
-        if jenkins_api_token:
-            jenkins_api_token = ConfigLoader._decode_if_base64('JENKINS_API_TOKEN', jenkins_api_token)
-
-        # Decode webhook secret if base64 encoded
-        jenkins_webhook_secret = os.getenv('JENKINS_WEBHOOK_SECRET')
-        if jenkins_webhook_secret:
-            jenkins_webhook_secret = ConfigLoader._decode_if_base64('JENKINS_WEBHOOK_SECRET', jenkins_webhook_secret)
+        env = os.environ if env is None else env
+        jenkins_enabled = _envbool(env, 'JENKINS_ENABLED', 'false')
+
+        # Connection settings are only read (and decoded) when Jenkins support is enabled
+        jenkins_url = jenkins_user = jenkins_api_token = jenkins_webhook_secret = None
+        if jenkins_enabled:
+            jenkins_url = env.get('JENKINS_URL')
+            if jenkins_url and jenkins_url.endswith('/'):
+                jenkins_url = jenkins_url.rstrip('/')
+
+            jenkins_user = env.get('JENKINS_USER')
+
+            # Decode API token if base64 encoded
+            jenkins_api_token = env.get('JENKINS_API_TOKEN')
+            if jenkins_api_token:
+                jenkins_api_token = ConfigLoader._decode_if_base64('JENKINS_API_TOKEN', jenkins_api_token, env)
+
+            # Decode webhook secret if base64 encoded
+            jenkins_webhook_secret = env.get('JENKINS_WEBHOOK_SECRET')
+            if jenkins_webhook_secret:
+                jenkins_webhook_secret = ConfigLoader._decode_if_base64(
+                    'JENKINS_WEBHOOK_SECRET', jenkins_webhook_secret, env
+                )
 
         # Filter handled failures (failures with try-catch that continued pipeline)
-        jenkins_filter_handled_failures_str = os.getenv('JENKINS_FILTER_HANDLED_FAILURES', 'true').lower()
-        jenkins_filter_handled_failures = jenkins_filter_handled_failures_str in ['true', '1', 'yes', 'on']
+        jenkins_filter_handled_failures = _envbool(env, 'JENKINS_FILTER_HANDLED_FAILURES', 'true')
 
         return {
             'jenkins_enabled': jenkins_enabled,
@@ -248,22 +305,19 @@ class ConfigLoader:
         }
 
     @staticmethod
-    def _load_bfa_config() -> Dict[str, Any]:
+    def _load_bfa_config(env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """Load BFA JWT configuration."""
-        bfa_host = os.getenv('BFA_HOST')
+        env = os.environ if env is None else env
+        bfa_host = env.get('BFA_HOST')
 
         # Decode BFA secret key if base64 encoded
-        bfa_secret_key = os.getenv('BFA_SECRET_KEY')
+        bfa_secret_key = env.get('BFA_SECRET_KEY')
         if bfa_secret_key:
-            bfa_secret_key = ConfigLoader._decode_if_base64('BFA_SECRET_KEY', bfa_secret_key)
-
-        # Auto-construct API POST URL from BFA_HOST
-        api_post_url = f"http://{bfa_host}:8000/api/analyze" if bfa_host else None
+            bfa_secret_key = ConfigLoader._decode_if_base64('BFA_SECRET_KEY', bfa_secret_key, env)
 
         return {
             'bfa_host': bfa_host,
-            'bfa_secret_key': bfa_secret_key,
-            'api_post_url': api_post_url
+            'bfa_secret_key': bfa_secret_key
         }
 
     @staticmethod
@@ -316,7 +370,7 @@ class ConfigLoader:
 
         if not thresholds:
             # Return default if empty
-            return [(50, 50, 10), (100, 10, 5), (150, 5, 2)]
+            return list(_DEFAULT_ADAPTIVE_THRESHOLDS)
 
         # Sort by threshold (ascending)
         thresholds.sort(key=lambda x: x[0])
@@ -332,23 +386,26 @@ class ConfigLoader:
         return thresholds
 
     @staticmethod
-    def _load_log_limits() -> Dict[str, Any]:
+    def _load_log_limits(env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """Load error context and log handling limits."""
-        error_context_lines_before = int(os.getenv('ERROR_CONTEXT_LINES_BEFORE', '50'))
-        error_context_lines_after = int(os.getenv('ERROR_CONTEXT_LINES_AFTER', '10'))
-        max_log_lines = int(os.getenv('MAX_LOG_LINES', '100000'))
-        tail_log_lines = int(os.getenv('TAIL_LOG_LINES', '5000'))
-        stream_chunk_size = int(os.getenv('STREAM_CHUNK_SIZE', '8192'))
+        env = os.environ if env is None else env
+        error_context_lines_before = _envint(env, 'ERROR_CONTEXT_LINES_BEFORE', '50')
+        error_context_lines_after = _envint(env, 'ERROR_CONTEXT_LINES_AFTER', '10')
+        max_log_lines = _envint(env, 'MAX_LOG_LINES', '100000')
+        tail_log_lines = _envint(env, 'TAIL_LOG_LINES', '5000')
+        stream_chunk_size = _envint(env, 'STREAM_CHUNK_SIZE', '8192')
 
         # Load adaptive context setting (default: true)
-        error_adaptive_context_enabled = os.getenv(
-            'ERROR_ADAPTIVE_CONTEXT_ENABLED', 'true'
-        ).lower() in ('true', '1', 'yes')
+        error_adaptive_context_enabled = _envbool(env, 'ERROR_ADAPTIVE_CONTEXT_ENABLED', 'true')
 
-        # Load adaptive context thresholds from single string config
-        error_adaptive_thresholds = ConfigLoader._parse_adaptive_thresholds(
-            os.getenv('ERROR_ADAPTIVE_THRESHOLDS', '50:50:10,100:10:5,150:5:2')
-        )
+        # Load adaptive context thresholds from single string config.
+        # They are only consulted when adaptive context is enabled, so skip parsing otherwise.
+        # The built-in default is checked by the test suite, so only user input is parsed here.
+        thresholds_str = env.get('ERROR_ADAPTIVE_THRESHOLDS')
+        if error_adaptive_context_enabled and thresholds_str is not None:
+            error_adaptive_thresholds = tuple(ConfigLoader._parse_adaptive_thresholds(thresholds_str))
+        else:
+            error_adaptive_thresholds = _DEFAULT_ADAPTIVE_THRESHOLDS
 
         return {
             'error_context_lines_before': error_context_lines_before,
@@ -361,7 +418,40 @@ class ConfigLoader:
         }
 
     @staticmethod
-    def load() -> Config:  # pylint: disable=too-many-branches
+    def load() -> Config:
+        """
+        Load configuration, parsing environment variables only on the first call.
+
+        Subsequent calls return the cached Config object.
+
+        Returns:
+            Config: Configuration object with all settings
+
+        Raises:
+            ValueError: If required environment variables are missing or invalid
+        """
+        global _cached_config  # pylint: disable=global-statement
+        if _cached_config is None:
+            _cached_config = ConfigLoader._load_from_env()
+        return _cached_config
+
+    @staticmethod
+    def reload() -> Config:
+        """
+        Discard the cached configuration and load it again from environment variables.
+
+        Returns:
+            Config: Freshly parsed configuration object
+
+        Raises:
+            ValueError: If required environment variables are missing or invalid
+        """
+        global _cached_config  # pylint: disable=global-statement
+        _cached_config = None
+        return ConfigLoader.load()
+
+    @staticmethod
+    def _load_from_env() -> Config:  # pylint: disable=too-many-branches
         """
         Load configuration from environment variables.
 
@@ -369,7 +459,7 @@ class ConfigLoader:
             Config: Configuration object with all settings
 
         Raises:
-            ValueError: If required environment variables are missing
+            ValueError: If required environment variables are missing or invalid
 
         Environment Variables:
             Required:
@@ -384,9 +474,12 @@ class ConfigLoader:
                 - RETRY_DELAY: Delay between retries in seconds (default: 2)
                 - LOG_LEVEL: Logging level (default: INFO)
         """
+        # Read every setting from one snapshot, so all group loaders see the same values
+        env = dict(os.environ)
+
         # Required settings
-        gitlab_url = os.getenv('GITLAB_URL')
-        gitlab_token = os.getenv('GITLAB_TOKEN')
+        gitlab_url = env.get('GITLAB_URL')
+        gitlab_token = env.get('GITLAB_TOKEN')
 
         if not gitlab_url:
             raise ValueError("GITLAB_URL environment variable is required")
@@ -394,41 +487,37 @@ class ConfigLoader:
             raise ValueError("GITLAB_TOKEN environment variable is required")
 
         # Decode GitLab token if base64 encoded
-        gitlab_token = ConfigLoader._decode_if_base64('GITLAB_TOKEN', gitlab_token)
+        gitlab_token = ConfigLoader._decode_if_base64('GITLAB_TOKEN', gitlab_token, env)
 
-        # Remove trailing slash from GitLab URL if present
-        gitlab_url = gitlab_url.rstrip('/')
+        if not _is_http_url(gitlab_url):
+            raise ValueError(f"Invalid GITLAB_URL: {gitlab_url}. Must start with http:// or https://")
+        if len(gitlab_token) < 10:
+            raise ValueError("GITLAB_TOKEN appears to be invalid (too short)")
+
+        # Remove trailing slash(es) from GitLab URL if present
+        if gitlab_url.endswith('/'):
+            gitlab_url = gitlab_url.rstrip('/')
 
         # Load configuration groups
-        basic = ConfigLoader._load_basic_settings()
-        log_filtering = ConfigLoader._load_log_filtering()
-        api_config = ConfigLoader._load_api_config()
-        jenkins = ConfigLoader._load_jenkins_config()
-        bfa = ConfigLoader._load_bfa_config()
-        log_limits = ConfigLoader._load_log_limits()
-
-        # Validate port number
-        if not 1 <= basic['webhook_port'] <= 65535:
-            raise ValueError(
-                f"Invalid WEBHOOK_PORT: {basic['webhook_port']}. Must be between 1 and 65535"
-            )
+        basic = ConfigLoader._load_basic_settings(env)
+        log_filtering = ConfigLoader._load_log_filtering(env)
+        api_config = ConfigLoader._load_api_config(env)
+        jenkins = ConfigLoader._load_jenkins_config(env)
+        bfa = ConfigLoader._load_bfa_config(env)
+        log_limits = ConfigLoader._load_log_limits(env)
 
         # Validate log level
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if basic['log_level'] not in valid_levels:
+        if basic['log_level'] not in _VALID_LEVELS:
             raise ValueError(
-                f"Invalid LOG_LEVEL: {basic['log_level']}. Must be one of {valid_levels}"
+                f"Invalid LOG_LEVEL: {basic['log_level']}. Must be one of {sorted(_VALID_LEVELS)}"
             )
 
-        # Validate API POST configuration
+        # Validate API POST configuration and auto-construct API POST URL from BFA_HOST
+        api_post_url = None
         if api_config['api_post_enabled']:
             if not bfa['bfa_host']:
                 raise ValueError("BFA_HOST is required when API_POST_ENABLED is true")
-            if api_config['api_post_timeout'] < 1 or api_config['api_post_timeout'] > 300:
-                raise ValueError(
-                    f"Invalid API_POST_TIMEOUT: {api_config['api_post_timeout']}. "
-                    "Must be between 1 and 300 seconds"
-                )
+            api_post_url = _BFA_URL_FMT(bfa['bfa_host'])
 
         # Validate Jenkins configuration
         # Note: When JENKINS_ENABLED=true, credentials can come from either:
@@ -462,7 +551,7 @@ class ConfigLoader:
                     )
 
             # Validate jenkins_url format if provided (optional with jenkins_instances.json)
-            if jenkins['jenkins_url'] and not jenkins['jenkins_url'].startswith(('http://', 'https://')):
+            if jenkins['jenkins_url'] and not _is_http_url(jenkins['jenkins_url']):
                 raise ValueError(
                     f"Invalid JENKINS_URL: {jenkins['jenkins_url']}. "
                     "Must start with http:// or https://"
@@ -471,37 +560,13 @@ class ConfigLoader:
         return Config(
             gitlab_url=gitlab_url,
             gitlab_token=gitlab_token,
-            webhook_port=basic['webhook_port'],
-            webhook_secret=basic['webhook_secret'],
-            log_output_dir=basic['log_output_dir'],
-            retry_attempts=basic['retry_attempts'],
-            retry_delay=basic['retry_delay'],
-            log_level=basic['log_level'],
-            log_save_pipeline_status=log_filtering['log_save_pipeline_status'],
-            log_save_projects=log_filtering['log_save_projects'],
-            log_exclude_projects=log_filtering['log_exclude_projects'],
-            log_save_job_status=log_filtering['log_save_job_status'],
-            log_save_metadata_always=log_filtering['log_save_metadata_always'],
-            api_post_enabled=api_config['api_post_enabled'],
-            api_post_url=bfa['api_post_url'],
-            api_post_timeout=api_config['api_post_timeout'],
-            api_post_retry_enabled=api_config['api_post_retry_enabled'],
-            api_post_save_to_file=api_config['api_post_save_to_file'],
-            jenkins_enabled=jenkins['jenkins_enabled'],
-            jenkins_url=jenkins['jenkins_url'],
-            jenkins_user=jenkins['jenkins_user'],
-            jenkins_api_token=jenkins['jenkins_api_token'],
-            jenkins_webhook_secret=jenkins['jenkins_webhook_secret'],
-            jenkins_filter_handled_failures=jenkins['jenkins_filter_handled_failures'],
-            bfa_host=bfa['bfa_host'],
-            bfa_secret_key=bfa['bfa_secret_key'],
-            error_context_lines_before=log_limits['error_context_lines_before'],
-            error_context_lines_after=log_limits['error_context_lines_after'],
-            error_adaptive_context_enabled=log_limits['error_adaptive_context_enabled'],
-            error_adaptive_thresholds=log_limits['error_adaptive_thresholds'],
-            max_log_lines=log_limits['max_log_lines'],
-            tail_log_lines=log_limits['tail_log_lines'],
-            stream_chunk_size=log_limits['stream_chunk_size']
+            api_post_url=api_post_url,
+            **basic,
+            **log_filtering,
+            **api_config,
+            **jenkins,
+            **bfa,
+            **log_limits
         )
 
     @staticmethod
@@ -509,6 +574,9 @@ class ConfigLoader:
         """
         Validate configuration settings.
 
+        load() already applies these checks while parsing the environment; this is
+        kept for Config objects constructed directly (e.g. in tests or scripts).
+
         Args:
             config (Config): Configuration object to validate
 
@@ -518,7 +586,7 @@ class ConfigLoader:
         Raises:
             ValueError: If configuration is invalid
         """
-        if not config.gitlab_url.startswith(('http://', 'https://')):
+        if not _is_http_url(config.gitlab_url):
             raise ValueError(f"Invalid GITLAB_URL: {config.gitlab_url}. Must start with http:// or https://")
 
         if len(config.gitlab_token) < 10:
@@ -6,14 +6,19 @@ It implements exponential backoff and configurable retry strategies to handle tr
 
 Data Flow:
     Function Call → retry_with_backoff() → [Attempt → Error → Wait → Retry] → Success/Failure
+    Coroutine Call → aretry_with_backoff() → same loop, awaiting asyncio.sleep() between attempts
 
 Invoked by: webhook_listener, log_fetcher, jenkins_log_fetcher, api_poster
 Invokes: None
 """
 
 import time
+import random
+import threading
+import asyncio
+import inspect
 import logging
-from typing import Callable, Any, Optional, Type, Tuple
+from typing import Callable, Any, Optional, Type, Tuple, Awaitable
 from functools import wraps
 
 # Configure module logger
@@ -60,9 +65,21 @@ class ErrorHandler:
         max_retries (int): Maximum number of retry attempts
         base_delay (float): Base delay in seconds between retries
         exponential (bool): Whether to use exponential backoff
+        jitter (bool): Whether to randomize each delay between 0 and its ceiling
+        max_delay (float): Upper bound in seconds for any single backoff delay
     """
 
-    def __init__(self, max_retries: int = 3, base_delay: float = 2.0, exponential: bool = True):
+    __slots__ = ('max_retries', 'base_delay', 'exponential', 'jitter', '_rng', 'max_delay')
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 2.0,
+        exponential: bool = True,
+        jitter: bool = True,
+        rng: Optional[random.Random] = None,
+        max_delay: float = 60.0
+    ):
         """
         Initialize the error handler.
 
@@ -70,10 +87,17 @@ class ErrorHandler:
             max_retries (int): Maximum number of retry attempts (default: 3)
             base_delay (float): Base delay in seconds between retries (default: 2.0)
             exponential (bool): Use exponential backoff if True, constant delay if False (default: True)
+            jitter (bool): Use full jitter so concurrent callers do not retry in lockstep (default: True)
+            rng (Optional[random.Random]): Random source for jitter; pass a seeded instance for
+                reproducible delays (default: a new random.Random())
+            max_delay (float): Cap in seconds applied to the backoff ceiling before jitter (default: 60.0)
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.exponential = exponential
+        self.jitter = jitter
+        self._rng = rng if rng is not None else random.Random()
+        self.max_delay = max_delay
 
     def retry_with_backoff(
         self,
@@ -116,18 +140,72 @@ class ErrorHandler:
 
             except exceptions as error:  # pylint: disable=redefined-outer-name
                 last_exception = error
-                if attempt < self.max_retries:
-                    delay = self._calculate_delay(attempt)
-                    logger.warning(
-                        "Attempt %d failed for %s: %s. Retrying in %.2f seconds...",
-                        attempt + 1, func.__name__, str(error), delay
+                if attempt == self.max_retries:
+                    logger.error(
+                        "All %d attempts failed for %s. Last error: %s",
+                        self.max_retries + 1, func.__name__, str(error)
                     )
+                    break
+                delay = self._calculate_delay(attempt)
+                logger.warning(
+                    "Attempt %d failed for %s: %s. Retrying in %.2f seconds...",
+                    attempt + 1, func.__name__, str(error), delay
+                )
+                if delay > 0:
                     time.sleep(delay)
-                else:
+
+        raise RetryExhaustedError(self.max_retries + 1, last_exception)
+
+    async def aretry_with_backoff(
+        self,
+        coro_fn: Callable[..., Awaitable[Any]],
+        *args,
+        exceptions: Tuple[Type[Exception], ...] = (Exception,),
+        **kwargs
+    ) -> Any:
+        """
+        Async variant of retry_with_backoff() for coroutine functions.
+
+        Waits between attempts with asyncio.sleep(), so other tasks on the event
+        loop keep running during the backoff instead of being blocked by time.sleep().
+
+        Args:
+            coro_fn (Callable[..., Awaitable[Any]]): Coroutine function to execute
+            *args: Positional arguments to pass to the function
+            exceptions (Tuple[Type[Exception], ...]): Tuple of exception types to catch and retry
+            **kwargs: Keyword arguments to pass to the function
+
+        Returns:
+            Any: The result of the successful awaited call
+
+        Raises:
+            RetryExhaustedError: If all retry attempts are exhausted
+        """
+        last_exception = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                logger.debug("Attempt %s/%s for %s", attempt + 1, self.max_retries + 1, coro_fn.__name__)
+                result = await coro_fn(*args, **kwargs)  # pylint: disable=redefined-outer-name
+                if attempt > 0:
+                    logger.info("Success on attempt %s for %s", attempt + 1, coro_fn.__name__)
+                return result
+
+            except exceptions as error:  # pylint: disable=redefined-outer-name
+                last_exception = error
+                if attempt == self.max_retries:
                     logger.error(
                         "All %d attempts failed for %s. Last error: %s",
-                        self.max_retries + 1, func.__name__, str(error)
+                        self.max_retries + 1, coro_fn.__name__, str(error)
                     )
+                    break
+                delay = self._calculate_delay(attempt)
+                logger.warning(
+                    "Attempt %d failed for %s: %s. Retrying in %.2f seconds...",
+                    attempt + 1, coro_fn.__name__, str(error), delay
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
 
         raise RetryExhaustedError(self.max_retries + 1, last_exception)
 
@@ -142,31 +220,40 @@ class ErrorHandler:
             float: Delay in seconds
 
         Implementation:
-            - Exponential: delay = base_delay * (2 ^ attempt)
-            - Constant: delay = base_delay
+            - Exponential: ceiling = base_delay * (2 ^ attempt)
+            - Constant: ceiling = base_delay
+            - Ceiling is clamped to max_delay before jitter is applied
+            - Full jitter: delay = uniform(0, ceiling), otherwise delay = ceiling
         """
-        if self.exponential:
-            return self.base_delay * (2 ** attempt)
-        return self.base_delay
+        ceiling = self.base_delay * (2 ** attempt) if self.exponential else self.base_delay
+        ceiling = min(self.max_delay, ceiling)
+        if self.jitter:
+            return self._rng.uniform(0, ceiling)
+        return ceiling
 
 
 def retry_on_failure(
     max_retries: int = 3,
     base_delay: float = 2.0,
     exponential: bool = True,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,)
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    jitter: bool = True,
+    max_delay: float = 60.0
 ):
     """
     Decorator for automatic retry with exponential backoff.
 
     This decorator can be applied to any function to automatically retry it
-    on failure with configurable retry parameters.
+    on failure with configurable retry parameters. Coroutine functions get an
+    async wrapper that backs off with asyncio.sleep() instead of blocking the loop.
 
     Args:
         max_retries (int): Maximum number of retry attempts (default: 3)
         base_delay (float): Base delay in seconds between retries (default: 2.0)
         exponential (bool): Use exponential backoff if True (default: True)
         exceptions (Tuple[Type[Exception], ...]): Exception types to catch (default: (Exception,))
+        jitter (bool): Randomize each delay between 0 and its ceiling (default: True)
+        max_delay (float): Cap in seconds for any single backoff delay (default: 60.0)
 
     Returns:
         Callable: Decorated function with retry logic
@@ -182,9 +269,28 @@ def retry_on_failure(
         Decorated Function Call → retry_wrapper() → ErrorHandler.retry_with_backoff() → Original Function
     """
     def decorator(func: Callable) -> Callable:
+        # The handler holds no per-call state, so one instance serves every call
+        handler = ErrorHandler(max_retries, base_delay, exponential, jitter, max_delay=max_delay)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await handler.aretry_with_backoff(func, *args, exceptions=exceptions, **kwargs)
+            return async_wrapper
+
+        if max_retries == 0:
+            # Single attempt: skip the retry loop but keep the RetryExhaustedError contract
+            @wraps(func)
+            def single_attempt_wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as error:  # pylint: disable=redefined-outer-name
+                    logger.error("All 1 attempts failed for %s. Last error: %s", func.__name__, str(error))
+                    raise RetryExhaustedError(1, error)  # pylint: disable=raise-missing-from
+            return single_attempt_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            handler = ErrorHandler(max_retries, base_delay, exponential)
             return handler.retry_with_backoff(func, *args, exceptions=exceptions, **kwargs)
         return wrapper
     return decorator
@@ -206,23 +312,39 @@ class CircuitBreaker:
         failure_threshold (int): Number of failures before opening circuit
         recovery_timeout (float): Time to wait before attempting recovery
         failure_count (int): Current number of consecutive failures
-        last_failure_time (Optional[float]): Timestamp of last failure
+        last_failure_time (Optional[float]): time.monotonic() reading of last failure
         state (str): Current circuit state (CLOSED, OPEN, HALF_OPEN)
+        expected_exceptions (Tuple[Type[Exception], ...]): Exception types counted as failures
     """
 
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+    __slots__ = (
+        'failure_threshold', 'recovery_timeout', 'expected_exceptions',
+        'failure_count', 'last_failure_time', 'state', '_lock'
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 60.0,
+        expected_exceptions: Tuple[Type[Exception], ...] = (Exception,)
+    ):
         """
         Initialize circuit breaker.
 
         Args:
             failure_threshold (int): Number of failures before opening circuit (default: 5)
             recovery_timeout (float): Seconds to wait before testing recovery (default: 60.0)
+            expected_exceptions (Tuple[Type[Exception], ...]): Exception types that count as
+                service failures; anything else propagates without touching the counters
+                (default: (Exception,))
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        self.expected_exceptions = expected_exceptions
         self.failure_count = 0
         self.last_failure_time: Optional[float] = None
         self.state = "CLOSED"
+        self._lock = threading.Lock()
 
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -239,45 +361,88 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is OPEN or function fails
         """
-        if self.state == "OPEN":
-            if self._should_attempt_reset():
-                self.state = "HALF_OPEN"
-                logger.info("Circuit breaker entering HALF_OPEN state")
-            else:
-                raise CircuitBreakerError()
+        self._before_call()
 
         try:
             result = func(*args, **kwargs)  # pylint: disable=redefined-outer-name
             self._on_success()
             return result
-        except Exception as error:  # pylint: disable=redefined-outer-name,broad-exception-caught
+        except self.expected_exceptions:
             self._on_failure()
-            raise error
+            raise
+
+    async def acall(self, coro_fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Await a coroutine function through the circuit breaker.
+
+        Async counterpart of call(); shares the same state and lock, so sync and
+        async callers trip and reset the same circuit.
+
+        Args:
+            coro_fn (Callable[..., Awaitable[Any]]): Coroutine function to execute
+            *args: Positional arguments for function
+            **kwargs: Keyword arguments for function
+
+        Returns:
+            Any: Awaited function result
+
+        Raises:
+            Exception: If circuit is OPEN or function fails
+        """
+        self._before_call()
+
+        try:
+            result = await coro_fn(*args, **kwargs)  # pylint: disable=redefined-outer-name
+            self._on_success()
+            return result
+        except self.expected_exceptions:
+            self._on_failure()
+            raise
+
+    def _before_call(self):
+        """
+        Admit or reject a call based on the current state.
+
+        The OPEN → HALF_OPEN transition happens under the lock so concurrent
+        callers observe a single consistent state.
+
+        Raises:
+            CircuitBreakerError: If circuit is OPEN and recovery timeout has not elapsed
+        """
+        with self._lock:
+            if self.state == "OPEN":
+                if self._should_attempt_reset():
+                    self.state = "HALF_OPEN"
+                    logger.info("Circuit breaker entering HALF_OPEN state")
+                else:
+                    raise CircuitBreakerError()
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt recovery."""
         if self.last_failure_time is None:
             return False
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+        return time.monotonic() - self.last_failure_time >= self.recovery_timeout
 
     def _on_success(self):
         """Handle successful function call."""
-        self.failure_count = 0
-        if self.state == "HALF_OPEN":
-            self.state = "CLOSED"
-            logger.info("Circuit breaker CLOSED after successful recovery")
+        with self._lock:
+            self.failure_count = 0
+            if self.state == "HALF_OPEN":
+                self.state = "CLOSED"
+                logger.info("Circuit breaker CLOSED after successful recovery")
 
     def _on_failure(self):
         """Handle failed function call."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-
-        if self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
-            logger.error(
-                "Circuit breaker OPEN after %d failures. Will attempt recovery in %d seconds",
-                self.failure_count, self.recovery_timeout
-            )
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+
+            if self.failure_count >= self.failure_threshold:
+                self.state = "OPEN"
+                logger.error(
+                    "Circuit breaker OPEN after %d failures. Will attempt recovery in %d seconds",
+                    self.failure_count, self.recovery_timeout
+                )
 
 
 if __name__ == "__main__":
@@ -14,13 +14,19 @@ Invokes: None
 
 import re
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from bisect import bisect_right
+from typing import Dict, Any, Optional, List, Iterator
+from datetime import datetime, timezone
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
 class JenkinsExtractor:
     """
     Extracts and parses Jenkins build information from webhooks and logs.
@@ -32,6 +38,9 @@ class JenkinsExtractor:
     - Combining Blue Ocean API data with console logs
     """
 
+    # No per-instance state; everything lives on the class
+    __slots__ = ()
+
     # Regex patterns for console log parsing
     STAGE_START_PATTERN = re.compile(r'\[Pipeline\] // stage \((.*?)\)')
     STAGE_HEADER_PATTERN = re.compile(r'\[Pipeline\] stage \((.*?)\)')
@@ -39,6 +48,17 @@ class JenkinsExtractor:
     PARALLEL_END_PATTERN = re.compile(r'\[Pipeline\] // parallel')
     PARALLEL_BRANCH_PATTERN = re.compile(r'\[Pipeline\] \{ \((.*?)\)')
 
+    # All of the above in one alternation, so each console line is searched once.
+    # lastgroup names the marker that matched.
+    PIPELINE_MARKER_PATTERN = re.compile(
+        r'\[Pipeline\] (?:'
+        r'(?P<stage_end>// stage \((?P<stage_end_name>.*?)\))'
+        r'|(?P<stage>stage \((?P<stage_name>.*?)\))'
+        r'|(?P<parallel_end>// parallel)'
+        r'|(?P<parallel>parallel)'
+        r'|(?P<branch>\{ \((?P<branch_name>.*?)\)))'
+    )
+
     def __init__(self):
         """Initialize the Jenkins extractor."""
         logger.info("Jenkins Extractor initialized")
@@ -66,7 +86,7 @@ class JenkinsExtractor:
         Raises:
             ValueError: If required fields are missing from payload
         """
-        logger.debug("Extracting webhook data from payload: %s", payload.keys())
+        logger.debug("Extracting webhook data from payload keys: %s", payload.keys())
 
         # Try custom format first (from Jenkinsfile curl)
         if 'job_name' in payload and 'build_number' in payload:
@@ -92,21 +112,30 @@ class JenkinsExtractor:
             'build_url': payload.get('build_url', ''),
             'status': payload.get('status', 'UNKNOWN'),
             'jenkins_url': payload.get('jenkins_url', ''),
-            'timestamp': payload.get('timestamp', datetime.utcnow().isoformat())
+            'timestamp': payload['timestamp'] if 'timestamp' in payload else _now_iso()
         }
 
     def _extract_generic_webhook_format(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Extract data from Generic Webhook Trigger plugin format."""
         job = payload.get('job', {})
         build = payload.get('build', {})
+        job_name = job.get('name', '')
+
+        # Job URLs look like <jenkins_url>/job/<name>[/]; drop that suffix, not a character set
+        jenkins_url = job.get('url', '')
+        if jenkins_url.endswith('/'):
+            jenkins_url = jenkins_url[:-1]
+        job_suffix = '/job/' + job_name
+        if job_name and jenkins_url.endswith(job_suffix):
+            jenkins_url = jenkins_url[:-len(job_suffix)]
 
         return {
-            'job_name': job.get('name', ''),
+            'job_name': job_name,
             'build_number': int(build.get('number', 0)),
             'build_url': build.get('url', ''),
             'status': build.get('status', 'UNKNOWN'),
-            'jenkins_url': job.get('url', '').rstrip('/job/' + job.get('name', '')),
-            'timestamp': datetime.utcnow().isoformat()
+            'jenkins_url': jenkins_url,
+            'timestamp': _now_iso()
         }
 
     def _extract_notification_format(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -119,7 +148,7 @@ class JenkinsExtractor:
             'build_url': build.get('url', ''),
             'status': build.get('status', 'UNKNOWN'),
             'jenkins_url': '',  # Not provided in notification format
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _now_iso()
         }
 
     def _extract_fallback(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -139,7 +168,7 @@ class JenkinsExtractor:
             'build_url': payload.get('build_url', ''),
             'status': payload.get('status', 'UNKNOWN'),
             'jenkins_url': payload.get('jenkins_url', ''),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _now_iso()
         }
 
     def parse_console_log(
@@ -189,6 +218,7 @@ class JenkinsExtractor:
 
         result = []
         log_lines = console_log.split('\n')
+        index = self._index_log_lines(log_lines)
 
         for stage in stages:
             stage_name = stage.get('name', 'Unknown')
@@ -205,7 +235,7 @@ class JenkinsExtractor:
                 parallel_blocks = []
                 for flow in parallel_flows:
                     block_name = flow.get('name', 'Unknown')
-                    block_log = self._extract_block_log(log_lines, block_name)
+                    block_log = self._extract_block_log(log_lines, block_name, index)
                     parallel_blocks.append({
                         'block_name': block_name,
                         'status': flow.get('status', 'UNKNOWN'),
@@ -223,7 +253,7 @@ class JenkinsExtractor:
                 })
             else:
                 # Single stage, extract its log
-                stage_log = self._extract_stage_log(log_lines, stage_name)
+                stage_log = self._extract_stage_log(log_lines, stage_name, index)
                 result.append({
                     'stage_name': stage_name,
                     'stage_id': stage_id,
@@ -240,32 +270,38 @@ class JenkinsExtractor:
         """Parse console log without Blue Ocean data (fallback)."""
         logger.debug("Parsing console log without Blue Ocean data")
 
-        log_lines = console_log.split('\n')
+        log_lines = self._iter_lines(console_log)
         stages = []
         current_stage = None
         in_parallel = False
         current_block = None
 
-        for _, line in enumerate(log_lines):
+        for line in log_lines:
+            # Most lines are build output; a substring test is far cheaper than a regex miss
+            if '[Pipeline]' not in line:
+                kind = None
+            else:
+                marker = self.PIPELINE_MARKER_PATTERN.search(line)
+                kind = marker.lastgroup if marker else None
+
             # Check for stage start
-            stage_match = self.STAGE_HEADER_PATTERN.search(line)
-            if stage_match:
+            if kind == 'stage':
                 # Save previous stage
                 if current_stage:
                     stages.append(current_stage)
 
                 current_stage = {
-                    'stage_name': stage_match.group(1),
+                    'stage_name': marker.group('stage_name'),
                     'stage_id': str(len(stages) + 1),
                     'status': 'UNKNOWN',
                     'duration_ms': 0,
                     'is_parallel': False,
-                    'log_content': ''
+                    'log_content': []  # line buffer, joined once parsing is done
                 }
                 continue
 
             # Check for parallel start
-            if self.PARALLEL_START_PATTERN.search(line):
+            if kind == 'parallel':
                 in_parallel = True
                 if current_stage:
                     current_stage['is_parallel'] = True
@@ -273,22 +309,21 @@ class JenkinsExtractor:
                 continue
 
             # Check for parallel branch
-            branch_match = self.PARALLEL_BRANCH_PATTERN.search(line)
-            if branch_match and in_parallel:
+            if kind == 'branch' and in_parallel:
                 if current_block:
                     if current_stage:
                         current_stage['parallel_blocks'].append(current_block)
 
                 current_block = {
-                    'block_name': branch_match.group(1),
+                    'block_name': marker.group('branch_name'),
                     'status': 'UNKNOWN',
                     'duration_ms': 0,
-                    'log_content': ''
+                    'log_content': []  # line buffer, joined once parsing is done
                 }
                 continue
 
             # Check for parallel end
-            if self.PARALLEL_END_PATTERN.search(line):
+            if kind == 'parallel_end':
                 if current_block and current_stage:
                     current_stage['parallel_blocks'].append(current_block)
                     current_block = None
@@ -297,68 +332,148 @@ class JenkinsExtractor:
 
             # Collect log lines
             if current_block:
-                current_block['log_content'] += line + '\n'
+                current_block['log_content'].append(line)
             elif current_stage:
-                if 'log_content' in current_stage:
-                    current_stage['log_content'] += line + '\n'
+                current_stage['log_content'].append(line)
 
         # Save last stage
         if current_stage:
             stages.append(current_stage)
 
+        # Join each line buffer once instead of growing strings line by line
+        self._join_log_buffers(stages)
+
         logger.info("Parsed %s stages from console log", len(stages))
         return stages
 
-    def _extract_stage_log(self, log_lines: List[str], stage_name: str) -> str:
-        """Extract log lines for a specific stage."""
-        in_stage = False
-        stage_log = []
-        stage_start_marker = f'stage ({stage_name})'
-        stage_end_marker = '// stage'
+    @staticmethod
+    def _iter_lines(text: str) -> Iterator[str]:
+        """
+        Yield the lines of text exactly as text.split('\\n') would, without building the list.
+
+        Console logs can be many megabytes; slicing the original string by offset
+        avoids holding a second copy of the log as millions of small line objects.
+        """
+        start = 0
+        end = text.find('\n')
+        while end != -1:
+            yield text[start:end]
+            start = end + 1
+            end = text.find('\n', start)
+        # Like split(), the remainder is yielded even when empty (final newline or empty log)
+        yield text[start:]
+
+    @staticmethod
+    def _join_log_buffers(stages: List[Dict[str, Any]]) -> None:
+        """Replace stage/block 'log_content' line lists with newline-terminated strings."""
+        for stage in stages:
+            for item in [stage] + stage.get('parallel_blocks', []):
+                lines = item['log_content']
+                item['log_content'] = '\n'.join(lines) + '\n' if lines else ''
+
+    @staticmethod
+    def _index_log_lines(log_lines: List[str]) -> Dict[str, List[int]]:
+        """
+        Record, in one pass, the lines the stage/block extractors look for.
+
+        Each list holds ascending line indices, so extracting S stages costs
+        O(N + S * log N) instead of rescanning all N lines per stage.
+
+        Args:
+            log_lines (List[str]): Console log split into lines
+
+        Returns:
+            Dict[str, List[int]]: Line indices keyed by 'stage_start', 'stage_end',
+                'block_start' and 'block_end'
+        """
+        index = {'stage_start': [], 'stage_end': [], 'block_start': [], 'block_end': []}
+
+        for idx, line in enumerate(log_lines):
+            lowered = line.lower()
+            if 'stage (' in lowered:
+                index['stage_start'].append(idx)
+            if '// stage' in lowered:
+                index['stage_end'].append(idx)
+            if '{ (' in line or 'Branch: ' in line:
+                index['block_start'].append(idx)
+            if '[Pipeline] }' in line or '// parallel' in line:
+                index['block_end'].append(idx)
+
+        return index
+
+    @staticmethod
+    def _slice_section(
+        log_lines: List[str],
+        starts: List[int],
+        ends: List[int],
+        is_start
+    ) -> Optional[List[str]]:
+        """
+        Return the lines between the first start line and the next end line.
+
+        Lines matching is_start are treated as start markers: they never end the
+        section and are not included in it. Returns None if no start line exists.
+        """
+        start = next((idx for idx in starts if is_start(log_lines[idx])), None)
+        if start is None:
+            return None
+
+        end = len(log_lines)
+        for idx in ends[bisect_right(ends, start):]:
+            if not is_start(log_lines[idx]):
+                end = idx
+                break
+
+        return [line for line in log_lines[start + 1:end] if not is_start(line)]
+
+    def _extract_stage_log(
+        self,
+        log_lines: List[str],
+        stage_name: str,
+        index: Optional[Dict[str, List[int]]] = None
+    ) -> str:
+        """Extract log lines for a specific stage (index: optional result of _index_log_lines)."""
+        stage_start_marker = f'stage ({stage_name})'.lower()
 
         logger.debug(
             "Extracting logs for stage '%s', looking for start marker: '%s'",
             stage_name, stage_start_marker
         )
 
-        for line in log_lines:
-            if stage_start_marker.lower() in line.lower():
-                in_stage = True
-                logger.debug("Found stage start marker for '%s' in line: %s", stage_name, line[:100])
-                continue
+        if index is None:
+            index = self._index_log_lines(log_lines)
 
-            if in_stage and stage_end_marker.lower() in line.lower():
-                logger.debug("Found stage end marker for '%s', extracted %d lines", stage_name, len(stage_log))
-                break
-
-            if in_stage:
-                stage_log.append(line)
+        stage_log = self._slice_section(
+            log_lines, index['stage_start'], index['stage_end'],
+            lambda line: stage_start_marker in line.lower()
+        )
 
         if not stage_log:
             logger.warning(
                 "No console log content extracted for stage '%s' (start marker not found or no content)",
                 stage_name
             )
-        else:
-            logger.debug("Successfully extracted %d log lines for stage '%s'", len(stage_log), stage_name)
+            return ''
 
+        logger.debug("Successfully extracted %d log lines for stage '%s'", len(stage_log), stage_name)
         return '\n'.join(stage_log)
 
-    def _extract_block_log(self, log_lines: List[str], block_name: str) -> str:
-        """Extract log lines for a specific parallel block."""
-        in_block = False
-        block_log = []
-
-        for line in log_lines:
-            if f'{{ ({block_name})' in line or f'Branch: {block_name}' in line:
-                in_block = True
-                continue
-
-            # Check for end of block
-            if in_block and ('[Pipeline] }' in line or '// parallel' in line):
-                break
-
-            if in_block:
-                block_log.append(line)
+    def _extract_block_log(
+        self,
+        log_lines: List[str],
+        block_name: str,
+        index: Optional[Dict[str, List[int]]] = None
+    ) -> str:
+        """Extract log lines for a specific parallel block (index: optional result of _index_log_lines)."""
+        branch_marker = f'{{ ({block_name})'
+        label_marker = f'Branch: {block_name}'
+
+        if index is None:
+            index = self._index_log_lines(log_lines)
+
+        block_log = self._slice_section(
+            log_lines, index['block_start'], index['block_end'],
+            lambda line: branch_marker in line or label_marker in line
+        )
 
-        return '\n'.join(block_log)
+        return '\n'.join(block_log or [])
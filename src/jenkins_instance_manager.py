@@ -18,17 +18,25 @@ import json
 import os
 import logging
 import base64
+import hmac
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class JenkinsInstance:
     """
     Data class representing a single Jenkins instance configuration.
 
+    frozen=True: Instances are read-only and hashable once loaded, so lookups can hand
+                 the same object to every webhook without defensive copies.
+
     Attributes:
         jenkins_url: Base URL of the Jenkins instance
         jenkins_user: Username for authentication
@@ -43,6 +51,110 @@ class JenkinsInstance:
     description: Optional[str] = None
 
 
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+@lru_cache(maxsize=2048)
+def _normalize_url(url: str) -> str:
+    """
+    Normalize Jenkins URL for consistent lookup.
+
+    Produces one canonical form per Jenkins endpoint: lowercase scheme and host,
+    IDN host encoded as punycode, default port (80/443) dropped, query string and
+    fragment dropped, trailing slashes removed. The path keeps its case, since
+    Jenkins context paths and job names are case-sensitive. Values without a
+    scheme fall back to lowercasing and trimming trailing slashes.
+
+    Memoized, since the same few Jenkins URLs arrive on every webhook.
+
+    Args:
+        url: Jenkins URL to normalize
+
+    Returns:
+        Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    if not parts.scheme or not parts.netloc:
+        return url.strip().rstrip('/').lower()
+
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ''
+    try:
+        host = host.encode('idna').decode('ascii')
+    except UnicodeError:
+        pass  # Leave hosts the idna codec rejects (e.g. overlong labels) as they are
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+
+    try:
+        port = parts.port
+    except ValueError:
+        port = None  # Non-numeric port: keep the netloc as written
+        host = parts.netloc.rpartition('@')[2].lower()
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    userinfo, _, _ = parts.netloc.rpartition('@')
+    netloc = f"{userinfo}@{host}" if userinfo else host
+
+    return urlunsplit((scheme, netloc, parts.path.rstrip('/'), '', ''))
+
+
+def _url_segments(normalized_url: str) -> List[str]:
+    """
+    Split a normalized URL into trie keys: 'scheme://netloc' followed by each path segment.
+
+    Args:
+        normalized_url: URL already passed through _normalize_url
+
+    Returns:
+        List of segments, e.g. ['https://ci.example.com', 'jenkins', 'job', 'foo']
+    """
+    parts = urlsplit(normalized_url)
+    return [f"{parts.scheme}://{parts.netloc}"] + [segment for segment in parts.path.split('/') if segment]
+
+
+class _URLTrieNode:
+    """Node of _URLTrie: child nodes keyed by URL segment, plus the instance ending here."""
+
+    __slots__ = ('children', 'instance')
+
+    def __init__(self):
+        self.children: Dict[str, '_URLTrieNode'] = {}
+        self.instance: Optional[JenkinsInstance] = None
+
+
+class _URLTrie:
+    """
+    Prefix tree of Jenkins base URLs, split on path segments.
+
+    Lets a URL with extra path components (e.g. '<base>/job/foo/12') resolve to
+    the configured instance with the longest matching base URL in a single descent.
+    """
+
+    def __init__(self):
+        self._root = _URLTrieNode()
+
+    def insert(self, normalized_url: str, instance: JenkinsInstance):
+        """Store instance at the node for normalized_url, replacing any earlier one."""
+        node = self._root
+        for segment in _url_segments(normalized_url):
+            node = node.children.setdefault(segment, _URLTrieNode())
+        node.instance = instance
+
+    def longest_prefix(self, normalized_url: str) -> Optional[JenkinsInstance]:
+        """Return the instance whose base URL is the longest segment-wise prefix of normalized_url."""
+        node = self._root
+        match = None
+        for segment in _url_segments(normalized_url):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.instance is not None:
+                match = node.instance
+        return match
+
+
 class JenkinsInstanceManager:
     """
     Manager class for handling multiple Jenkins instances.
@@ -60,8 +172,47 @@ class JenkinsInstanceManager:
         """
         self.config_file = config_file
         self.instances: Dict[str, JenkinsInstance] = {}
+        self._url_trie = _URLTrie()
+        self._reload_lock = threading.Lock()
+        self._reload_future: Optional[Future] = None
         self._load_instances()
 
+    def reload(self) -> int:
+        """
+        Re-read the configuration file and replace the loaded instances.
+
+        Concurrent callers are coalesced: the first one parses the file and the
+        others wait for and share its outcome instead of parsing it again.
+        Lookups keep using the previous instances until the new set is complete.
+        If the file has been removed, all instances are dropped (the .env
+        configuration takes over again, as at startup without the file).
+
+        Returns:
+            Number of instances loaded
+
+        Raises:
+            ValueError: If the configuration file is invalid (previous instances are kept)
+        """
+        with self._reload_lock:
+            future = self._reload_future
+            is_leader = future is None
+            if is_leader:
+                future = self._reload_future = Future()
+
+        if is_leader:
+            try:
+                self._load_instances()
+                future.set_result(len(self.instances))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                future.set_exception(error)
+            finally:
+                with self._reload_lock:
+                    self._reload_future = None
+        else:
+            logger.debug("Jenkins instances reload already in progress, waiting for it")
+
+        return future.result()
+
     def _decode_if_base64(self, value: str, encoding_type: Optional[str]) -> str:
         """
         Decode value if it's base64 encoded.
@@ -88,6 +239,9 @@ class JenkinsInstanceManager:
         """
         Load Jenkins instances from configuration file.
 
+        The new instances are collected into fresh structures and swapped in at
+        the end, so concurrent lookups never see a partially loaded set.
+
         The configuration file should be in JSON format:
         {
             "instances": [
@@ -112,8 +266,11 @@ class JenkinsInstanceManager:
         }
         """
         if not os.path.exists(self.config_file):
-            # No configuration file - this is okay, will fall back to env vars
+            # No configuration file - this is okay, will fall back to env vars.
+            # Drop anything loaded earlier so a removed file does not leave stale credentials.
             logger.debug("Jenkins instances file not found: %s", self.config_file)
+            self.instances = {}
+            self._url_trie = _URLTrie()
             return
 
         logger.info("Loading Jenkins instances from: %s", self.config_file)
@@ -123,9 +280,11 @@ class JenkinsInstanceManager:
                 config = json.load(file_handle)
 
             instances_list = config.get('instances', [])
+            instances: Dict[str, JenkinsInstance] = {}
+            url_trie = _URLTrie()
 
             for instance_data in instances_list:
-                normalized_url = self._normalize_url(instance_data['jenkins_url'])
+                normalized_url = _normalize_url(instance_data['jenkins_url'])
 
                 # Decode tokens if they're base64 encoded
                 token_encoding = instance_data.get('token_encoding', 'plain')
@@ -148,8 +307,13 @@ class JenkinsInstanceManager:
                     description=instance_data.get('description')
                 )
 
-                # Store instance keyed by normalized URL
-                self.instances[instance.jenkins_url] = instance
+                # Store instance keyed by normalized URL, and in the trie for sub-path lookups
+                instances[instance.jenkins_url] = instance
+                url_trie.insert(instance.jenkins_url, instance)
+
+            # Swap in the complete set instead of filling the live structures
+            self._url_trie = url_trie
+            self.instances = instances
 
             logger.info("Successfully loaded %d Jenkins instance(s)", len(self.instances))
 
@@ -159,9 +323,7 @@ class JenkinsInstanceManager:
 
     def _normalize_url(self, url: str) -> str:
         """
-        Normalize Jenkins URL for consistent lookup.
-
-        Removes trailing slashes and converts to lowercase.
+        Normalize Jenkins URL for consistent lookup (see module-level _normalize_url).
 
         Args:
             url: Jenkins URL to normalize
@@ -169,20 +331,31 @@ class JenkinsInstanceManager:
         Returns:
             Normalized URL
         """
-        return url.rstrip('/').lower()
+        return _normalize_url(url)
+
+    def _lookup(self, normalized_url: str) -> Optional[JenkinsInstance]:
+        """Find the instance for an already-normalized URL: exact match, then longest prefix."""
+        instance = self.instances.get(normalized_url)
+        if instance is None:
+            instance = self._url_trie.longest_prefix(normalized_url)
+        return instance
 
     def get_instance(self, jenkins_url: str) -> Optional[JenkinsInstance]:
         """
         Get Jenkins instance configuration by URL.
 
+        An exact match on the normalized URL is tried first. Otherwise the
+        instance with the longest configured base URL that prefixes jenkins_url
+        (on path-segment boundaries) is returned, so job or build URLs resolve too.
+
         Args:
             jenkins_url: Jenkins URL to look up
 
         Returns:
             JenkinsInstance if found, None otherwise
         """
-        normalized_url = self._normalize_url(jenkins_url)
-        instance = self.instances.get(normalized_url)
+        normalized_url = _normalize_url(jenkins_url)
+        instance = self._lookup(normalized_url)
 
         if not instance:
             logger.warning(
@@ -222,7 +395,8 @@ class JenkinsInstanceManager:
         Returns:
             True if validation passes (or no secret configured), False otherwise
         """
-        instance = self.get_instance(jenkins_url)
+        # Look up directly: a missing instance is not worth a warning here
+        instance = self._lookup(_normalize_url(jenkins_url))
         if not instance or not instance.jenkins_webhook_secret:
             # No instance found or no secret configured - allow
             return True
@@ -231,5 +405,9 @@ class JenkinsInstanceManager:
             # Secret is configured but not provided
             return False
 
-        # Simple string comparison (Jenkins doesn't use HMAC)
-        return provided_secret == instance.jenkins_webhook_secret
+        # Jenkins sends the shared secret itself (no HMAC signature); compare in constant time.
+        # compare_digest() only accepts ASCII str, so compare the UTF-8 bytes.
+        return hmac.compare_digest(
+            provided_secret.encode('utf-8'),
+            instance.jenkins_webhook_secret.encode('utf-8')
+        )
@@ -11,12 +11,15 @@ Invoked by: webhook_listener
 Invokes: config_loader, error_handler
 """
 
+import io
 import json
 import logging
 import os
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, IO
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from .config_loader import Config
@@ -25,6 +28,13 @@ from .error_handler import ErrorHandler, RetryExhaustedError
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections pooled per Jenkins host by each fetcher's session;
+# also caps the workers fetch_all_stage_logs() runs so none waits for a connection
+_POOL_MAXSIZE = 16
+
+# Decoded characters handed to the sink per write when streaming console logs
+_CONSOLE_CHUNK_SIZE = 64 * 1024
+
 
 class JenkinsLogFetcher:
     """
@@ -38,6 +48,7 @@ class JenkinsLogFetcher:
     Attributes:
         jenkins_url (str): Jenkins instance URL
         auth (HTTPBasicAuth): Jenkins API authentication
+        session (requests.Session): Authenticated session reusing keep-alive connections
         error_handler (ErrorHandler): Retry handler for failed requests
     """
 
@@ -80,6 +91,14 @@ class JenkinsLogFetcher:
         else:
             raise ValueError("Must provide either config or explicit Jenkins credentials")
 
+        # One session per fetcher so the several calls made per build reuse the
+        # TCP/TLS connection; retries stay with error_handler, not urllib3
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        adapter = HTTPAdapter(pool_connections=_POOL_MAXSIZE, pool_maxsize=_POOL_MAXSIZE, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Initialize error handler for retries
         self.error_handler = ErrorHandler(
             max_retries=retry_attempts,
@@ -138,6 +157,30 @@ class JenkinsLogFetcher:
         Returns:
             str: Complete console log output
 
+        Raises:
+            requests.exceptions.RequestException: If API request fails
+        """
+        buffer = io.StringIO()
+        self.fetch_console_log_to(job_name, build_number, buffer)
+        return buffer.getvalue()
+
+    def fetch_console_log_to(self, job_name: str, build_number: int, sink: IO[str]) -> int:
+        """
+        Stream console log from Jenkins build into a writable text sink.
+
+        The log is decoded and written chunk by chunk, so peak memory stays at one
+        chunk instead of the raw body plus its decoded copy. Connecting and reading
+        the response headers are retried; once chunks have been written to the sink
+        a failure is raised rather than retried, since the sink is already partly filled.
+
+        Args:
+            job_name (str): Name of the Jenkins job
+            build_number (int): Build number
+            sink (IO[str]): Text stream the log is written to (file, io.StringIO, ...)
+
+        Returns:
+            int: Number of characters written
+
         Raises:
             requests.exceptions.RequestException: If API request fails
         """
@@ -149,17 +192,9 @@ class JenkinsLogFetcher:
                 self._make_request,
                 'GET',
                 url,
+                stream=True,
                 exceptions=(requests.exceptions.RequestException,)
             )
-
-            console_log = response.text
-            log_size = len(console_log)
-            logger.info(
-                "Successfully fetched console log for job %s #%s (%s bytes)",
-                job_name, build_number, log_size
-            )
-            return console_log
-
         except RetryExhaustedError as error:
             logger.error(
                 "Failed to fetch console log for job %s #%s after retries: %s",
@@ -167,6 +202,22 @@ class JenkinsLogFetcher:
             )
             raise
 
+        log_size = 0
+        try:
+            if response.encoding is None:
+                response.encoding = 'utf-8'  # iter_content() only decodes when an encoding is known
+            for chunk in response.iter_content(chunk_size=_CONSOLE_CHUNK_SIZE, decode_unicode=True):
+                sink.write(chunk)
+                log_size += len(chunk)
+        finally:
+            response.close()
+
+        logger.info(
+            "Successfully fetched console log for job %s #%s (%s bytes)",
+            job_name, build_number, log_size
+        )
+        return log_size
+
     def fetch_console_log_tail(self, job_name: str, build_number: int, tail_lines: Optional[int] = None) -> str:
         """
         Fetch only the last N lines of console log (memory efficient).
@@ -189,9 +240,12 @@ class JenkinsLogFetcher:
         url = f"{self.jenkins_url}/job/{job_name}/{build_number}/consoleText"
         logger.info("Fetching console log tail (last %d lines) for job %s #%s", tail_lines, job_name, build_number)
 
+        # Byte offsets must refer to the uncompressed log, so the tail is fetched without gzip
+        identity = {'Accept-Encoding': 'identity'}
+
         try:
             # First, get total log size
-            head_response = requests.head(url, auth=self.auth, timeout=10)
+            head_response = self.session.head(url, headers=identity, timeout=10)
             total_size = int(head_response.headers.get('Content-Length', 0))
 
             if total_size == 0:
@@ -210,8 +264,8 @@ class JenkinsLogFetcher:
             logger.debug("Total log size: %d bytes, fetching from byte %d", total_size, start_pos)
 
             # Fetch from start position
-            headers = {'Range': f'bytes={start_pos}-'} if start_pos > 0 else {}
-            response = requests.get(url, auth=self.auth, headers=headers, timeout=60)
+            headers = dict(identity, Range=f'bytes={start_pos}-') if start_pos > 0 else identity
+            response = self.session.get(url, headers=headers, timeout=60)
             response.raise_for_status()
 
             tail_log = response.text
@@ -256,7 +310,7 @@ class JenkinsLogFetcher:
 
         try:
             # Stream the response
-            response = requests.get(url, auth=self.auth, stream=True, timeout=120)
+            response = self.session.get(url, stream=True, timeout=120)
             response.raise_for_status()
 
             collected_lines = []
@@ -436,6 +490,40 @@ class JenkinsLogFetcher:
             logger.warning("Failed to fetch stage log (non-critical): %s", error)
             return None
 
+    def fetch_all_stage_logs(self, job_name: str, build_number: int, stage_ids: List[str],
+                             tail_lines: Optional[int] = None) -> Dict[str, Optional[str]]:
+        """
+        Fetch the logs of several stages concurrently.
+
+        Each stage log is a separate network round trip, so they are fetched on a
+        thread pool (at most one worker per pooled connection) instead of one after another.
+
+        Args:
+            job_name (str): Name of the Jenkins job
+            build_number (int): Build number
+            stage_ids (List[str]): Stage IDs from Blue Ocean API
+            tail_lines (Optional[int]): If set, trim each log to its last N lines as
+                fetch_stage_log_tail does; full logs are returned otherwise
+
+        Returns:
+            Dict[str, Optional[str]]: Stage log (or None if not available) keyed by stage ID
+
+        Raises:
+            Exception: Any error raised while fetching one of the stages
+        """
+        if not stage_ids:
+            return {}
+
+        logger.debug("Fetching %d stage logs for job %s #%s", len(stage_ids), job_name, build_number)
+
+        def fetch(stage_id: str) -> Optional[str]:
+            if tail_lines is None:
+                return self.fetch_stage_log(job_name, build_number, stage_id)
+            return self.fetch_stage_log_tail(job_name, build_number, stage_id, tail_lines)
+
+        with ThreadPoolExecutor(max_workers=min(_POOL_MAXSIZE, len(stage_ids))) as executor:
+            return dict(zip(stage_ids, executor.map(fetch, stage_ids)))
+
     def fetch_stage_log_tail(self, job_name: str, build_number: int, stage_id: str,
                              tail_lines: Optional[int] = None) -> Optional[str]:
         """
@@ -497,7 +585,7 @@ class JenkinsLogFetcher:
 
     def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
         """
-        Make an authenticated HTTP request to Jenkins API.
+        Make an authenticated HTTP request to Jenkins API over the pooled session.
 
         Args:
             method (str): HTTP method (GET, POST, etc.)
@@ -512,13 +600,30 @@ class JenkinsLogFetcher:
         """
         timeout = kwargs.pop('timeout', 30)
 
-        response = requests.request(
+        response = self.session.request(
             method=method,
             url=url,
-            auth=self.auth,
             timeout=timeout,
             **kwargs
         )
 
         response.raise_for_status()
         return response
+
+    def close(self):
+        """
+        Close the HTTP session.
+
+        Should be called when the fetcher is no longer needed to release pooled connections.
+        """
+        self.session.close()
+        logger.debug("Jenkins log fetcher session closed for: %s", self.jenkins_url)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - ensure the session is closed."""
+        self.close()
+        return False  # Don't suppress exceptions
@@ -28,6 +28,7 @@ import hmac
 import uuid
 import time
 import tempfile
+import threading
 import re
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
@@ -45,7 +46,7 @@ from .monitoring import PipelineMonitor, RequestStatus
 from .api_poster import ApiPoster
 from .jenkins_extractor import JenkinsExtractor
 from .jenkins_log_fetcher import JenkinsLogFetcher
-from .jenkins_instance_manager import JenkinsInstanceManager
+from .jenkins_instance_manager import JenkinsInstance, JenkinsInstanceManager
 from .log_error_extractor import LogErrorExtractor
 from .token_manager import TokenManager
 from .logging_config import (
@@ -115,6 +116,45 @@ jenkins_log_fetcher: Optional[JenkinsLogFetcher] = None
 jenkins_instance_manager: Optional[JenkinsInstanceManager] = None
 token_manager: Optional[TokenManager] = None
 
+# Fetchers for instances from jenkins_instances.json, keyed by instance URL and reused
+# across builds so their pooled keep-alive sessions are not rebuilt per webhook.
+# Each entry also records the (instance, retry_attempts, retry_delay) it was built with.
+_jenkins_instance_fetchers: Dict[str, Tuple[Tuple[JenkinsInstance, int, int], JenkinsLogFetcher]] = {}
+_jenkins_instance_fetchers_lock = threading.Lock()
+
+
+def _load_jenkins_instance_manager(
+    manager: Optional[JenkinsInstanceManager]
+) -> Optional[JenkinsInstanceManager]:
+    """
+    Load jenkins_instances.json, reusing an existing manager on re-initialization.
+
+    Args:
+        manager: Manager from a previous init_app call, if any
+
+    Returns:
+        JenkinsInstanceManager, or None if the file could not be loaded and no
+        previously loaded instances are available
+    """
+    try:
+        if manager is None:
+            manager = JenkinsInstanceManager()
+        else:
+            # Re-initialization: re-read jenkins_instances.json in place so lookups
+            # in flight keep working (previous instances are kept if the file is invalid)
+            manager.reload()
+        if manager.has_instances():
+            logger.info("7. Jenkins instance manager loaded: %d instances configured", len(manager.instances))
+            for url in manager.get_all_urls():
+                logger.debug("7. Jenkins instance: %s", url)
+        else:
+            logger.debug("7. No jenkins_instances.json found - will use .env configuration")
+    except ValueError as error:
+        logger.error("7. Failed to load Jenkins instance manager: %s", error)
+        if manager is None or not manager.has_instances():
+            manager = None
+    return manager
+
 
 def init_app():  # pylint: disable=too-many-branches
     """
@@ -137,9 +177,8 @@ def init_app():  # pylint: disable=too-many-branches
     global jenkins_extractor, jenkins_log_fetcher, jenkins_instance_manager, token_manager
 
     try:
-        # Load configuration first
+        # Load configuration first (validated while loading)
         config = ConfigLoader.load()
-        ConfigLoader.validate(config)
 
         # Initialize logging with configuration
         setup_logging(log_dir=config.log_output_dir, log_level=config.log_level)
@@ -216,20 +255,12 @@ def init_app():  # pylint: disable=too-many-branches
             api_poster = None
 
         # Initialize Jenkins instance manager (supports multiple Jenkins instances)
-        try:
-            jenkins_instance_manager = JenkinsInstanceManager()
-            if jenkins_instance_manager.has_instances():
-                logger.info(
-                    "7. Jenkins instance manager loaded: %d instances configured",
-                    len(jenkins_instance_manager.instances)
-                )
-                for url in jenkins_instance_manager.get_all_urls():
-                    logger.debug("7. Jenkins instance: %s", url)
-            else:
-                logger.debug("7. No jenkins_instances.json found - will use .env configuration")
-        except ValueError as error:
-            logger.error("7. Failed to load Jenkins instance manager: %s", error)
-            jenkins_instance_manager = None
+        jenkins_instance_manager = _load_jenkins_instance_manager(jenkins_instance_manager)
+
+        # Fetchers built under a previous configuration must not outlive it
+        if jenkins_log_fetcher:
+            jenkins_log_fetcher.close()
+        _close_jenkins_fetchers()
 
         # Initialize Jenkins components if enabled (fallback to .env config)
         if config.jenkins_enabled:
@@ -896,13 +927,7 @@ def _get_jenkins_fetcher_for_build(
     instance = jenkins_instance_manager.get_instance(jenkins_url)
     if instance:
         logger.info("Using credentials for Jenkins instance: %s", jenkins_url)
-        return JenkinsLogFetcher(
-            jenkins_url=instance.jenkins_url,
-            jenkins_user=instance.jenkins_user,
-            jenkins_api_token=instance.jenkins_api_token,
-            retry_attempts=config.retry_attempts,
-            retry_delay=config.retry_delay
-        )
+        return _get_instance_fetcher(instance)
 
     logger.warning("No configuration found for Jenkins URL: %s", jenkins_url)
 
@@ -914,6 +939,50 @@ def _get_jenkins_fetcher_for_build(
     return None
 
 
+def _get_instance_fetcher(instance: JenkinsInstance) -> JenkinsLogFetcher:
+    """
+    Return the cached fetcher for a Jenkins instance, creating it on first use.
+
+    A fetcher built for a different instance or retry configuration (e.g. credentials
+    changed after a reload of jenkins_instances.json) is replaced. The stale fetcher is
+    only dropped from the cache, not closed, since another build may still be using it;
+    its session is released once that build lets go of it.
+
+    Args:
+        instance: Jenkins instance configuration
+
+    Returns:
+        JenkinsLogFetcher bound to the instance credentials
+    """
+    settings = (instance, config.retry_attempts, config.retry_delay)
+
+    with _jenkins_instance_fetchers_lock:
+        cached = _jenkins_instance_fetchers.get(instance.jenkins_url)
+        if cached and cached[0] == settings:
+            return cached[1]
+
+        fetcher = JenkinsLogFetcher(
+            jenkins_url=instance.jenkins_url,
+            jenkins_user=instance.jenkins_user,
+            jenkins_api_token=instance.jenkins_api_token,
+            retry_attempts=config.retry_attempts,
+            retry_delay=config.retry_delay
+        )
+        _jenkins_instance_fetchers[instance.jenkins_url] = (settings, fetcher)
+
+    return fetcher
+
+
+def _close_jenkins_fetchers():
+    """Close and forget all cached per-instance Jenkins fetchers."""
+    with _jenkins_instance_fetchers_lock:
+        fetchers = [fetcher for _, fetcher in _jenkins_instance_fetchers.values()]
+        _jenkins_instance_fetchers.clear()
+
+    for fetcher in fetchers:
+        fetcher.close()
+
+
 def _fetch_jenkins_build_metadata(
     fetcher: 'JenkinsLogFetcher',
     job_name: str,
@@ -1142,6 +1211,25 @@ def _try_fetch_stage_log_via_api(fetcher: 'JenkinsLogFetcher', job_name: str, bu
     return None
 
 
+def _prefetch_stage_logs(fetcher: 'JenkinsLogFetcher', job_name: str, build_number: int,
+                         failed_stages: list) -> Dict[str, Optional[str]]:
+    """
+    Fetch stage log tails for all failed stages concurrently.
+
+    Only worthwhile with more than one stage. Returns an empty dict when skipped or
+    when the batch fetch fails, in which case stages are fetched one by one.
+    """
+    stage_ids = [stage['stage_id'] for stage in failed_stages if stage.get('stage_id')]
+    if len(stage_ids) < 2:
+        return {}
+
+    try:
+        return fetcher.fetch_all_stage_logs(job_name, build_number, stage_ids, tail_lines=config.tail_log_lines)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        logger.warning("Concurrent stage log fetch failed, fetching stages one by one: %s", error)
+        return {}
+
+
 def _extract_stage_section_from_console(console_log: str, stage_name: str) -> Optional[str]:
     """
     Extract a specific stage section from console log.
@@ -1368,6 +1456,9 @@ def _extract_failed_stages_with_logs(
     # Build base path for logs (same structure as storage_manager)
     base_log_dir = Path(config.log_output_dir if config else "./logs") / "jenkins-builds" / job_name / str(build_number)
 
+    # Stage logs are independent round trips, so fetch them up front in parallel
+    prefetched_logs = _prefetch_stage_logs(fetcher, job_name, build_number, failed_stages)
+
     # For each failed stage, extract logs using bottom-up approach
     for stage in failed_stages:
         stage_name = stage.get('stage_name')
@@ -1376,7 +1467,15 @@ def _extract_failed_stages_with_logs(
         safe_stage_name = stage_name.lower().replace(' ', '_').replace('/', '_')
 
         # Strategy 1: Try to fetch stage-specific logs via Blue Ocean API (bottom-up)
-        stage_log = _try_fetch_stage_log_via_api(fetcher, job_name, build_number, stage_id, stage_name)
+        if stage_id in prefetched_logs:
+            stage_log = prefetched_logs[stage_id]
+            if not stage_log:
+                logger.warning(
+                    "Stage log fetch returned None for stage '%s' (ID: %s), falling back to console parsing",
+                    stage_name, stage_id
+                )
+        else:
+            stage_log = _try_fetch_stage_log_via_api(fetcher, job_name, build_number, stage_id, stage_name)
         if stage_log:
             # Store full stage log for later file saving
             stage['stage_full_log'] = stage_log
@@ -2332,6 +2431,9 @@ async def shutdown_event():
     """FastAPI shutdown event handler. Performs cleanup when the server stops"""
     if log_fetcher:
         log_fetcher.close()
+    if jenkins_log_fetcher:
+        jenkins_log_fetcher.close()
+    _close_jenkins_fetchers()
     if monitor:
         monitor.close()
     logger.info("Application shutdown complete")
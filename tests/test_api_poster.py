@@ -13,6 +13,7 @@ Comprehensive test coverage for API posting functionality including:
 """
 
 import unittest
+from dataclasses import replace
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 import sys
@@ -266,7 +267,7 @@ class TestApiPoster(unittest.TestCase):
         mock_post.return_value = mock_response
 
         # Disable retry for this test
-        self.config.api_post_retry_enabled = False
+        self.config = replace(self.config, api_post_retry_enabled=False)
 
         poster = ApiPoster(self.config)
         result = poster.post_pipeline_logs(self.pipeline_info, self.all_logs)
@@ -284,7 +285,7 @@ class TestApiPoster(unittest.TestCase):
         mock_post.return_value = mock_response
 
         # Disable retry for this test
-        self.config.api_post_retry_enabled = False
+        self.config = replace(self.config, api_post_retry_enabled=False)
 
         poster = ApiPoster(self.config)
         result = poster.post_pipeline_logs(self.pipeline_info, self.all_logs)
@@ -302,7 +303,7 @@ class TestApiPoster(unittest.TestCase):
         mock_post.return_value = mock_response
 
         # Disable retry for this test
-        self.config.api_post_retry_enabled = False
+        self.config = replace(self.config, api_post_retry_enabled=False)
 
         poster = ApiPoster(self.config)
         result = poster.post_pipeline_logs(self.pipeline_info, self.all_logs)
@@ -316,7 +317,7 @@ class TestApiPoster(unittest.TestCase):
         mock_post.side_effect = requests.exceptions.Timeout("Request timed out after 30 seconds")
 
         # Disable retry for this test
-        self.config.api_post_retry_enabled = False
+        self.config = replace(self.config, api_post_retry_enabled=False)
 
         poster = ApiPoster(self.config)
         result = poster.post_pipeline_logs(self.pipeline_info, self.all_logs)
@@ -330,7 +331,7 @@ class TestApiPoster(unittest.TestCase):
         mock_post.side_effect = requests.exceptions.ConnectionError("Failed to establish connection")
 
         # Disable retry for this test
-        self.config.api_post_retry_enabled = False
+        self.config = replace(self.config, api_post_retry_enabled=False)
 
         poster = ApiPoster(self.config)
         result = poster.post_pipeline_logs(self.pipeline_info, self.all_logs)
@@ -544,8 +545,7 @@ class TestApiPoster(unittest.TestCase):
     @patch('requests.post')
     def test_fetch_token_from_bfa_server_success(self, mock_post):
         """Test successful token fetching from BFA server."""
-        self.config.bfa_host = "bfa-server.example.com"
-        self.config.bfa_secret_key = None
+        self.config = replace(self.config, bfa_host="bfa-server.example.com", bfa_secret_key=None)
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -564,8 +564,7 @@ class TestApiPoster(unittest.TestCase):
     @patch('requests.post')
     def test_fetch_token_from_bfa_server_uses_cache(self, mock_post):
         """Test that cached token is reused if still valid."""
-        self.config.bfa_host = "bfa-server.example.com"
-        self.config.bfa_secret_key = None
+        self.config = replace(self.config, bfa_host="bfa-server.example.com", bfa_secret_key=None)
 
         poster = ApiPoster(self.config)
         # Set up cached token
@@ -582,8 +581,7 @@ class TestApiPoster(unittest.TestCase):
     @patch('requests.post')
     def test_fetch_token_from_bfa_server_request_failure(self, mock_post):
         """Test token fetching when HTTP request fails."""
-        self.config.bfa_host = "bfa-server.example.com"
-        self.config.bfa_secret_key = None
+        self.config = replace(self.config, bfa_host="bfa-server.example.com", bfa_secret_key=None)
 
         mock_post.side_effect = requests.exceptions.ConnectionError("Network error")
 
@@ -595,8 +593,7 @@ class TestApiPoster(unittest.TestCase):
     @patch('requests.post')
     def test_fetch_token_from_bfa_server_missing_token_field(self, mock_post):
         """Test token fetching when response is missing token field."""
-        self.config.bfa_host = "bfa-server.example.com"
-        self.config.bfa_secret_key = None
+        self.config = replace(self.config, bfa_host="bfa-server.example.com", bfa_secret_key=None)
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -610,8 +607,7 @@ class TestApiPoster(unittest.TestCase):
 
     def test_fetch_token_without_bfa_host_configured(self):
         """Test token fetching fails when BFA_HOST is not configured."""
-        self.config.bfa_host = None
-        self.config.bfa_secret_key = None
+        self.config = replace(self.config, bfa_host=None, bfa_secret_key=None)
 
         poster = ApiPoster(self.config)
         token = poster._fetch_token_from_bfa_server("gitlab_repo_123")
@@ -621,7 +617,7 @@ class TestApiPoster(unittest.TestCase):
     @patch('requests.post')
     def test_post_to_api_with_jwt_generation(self, mock_post):
         """Test _post_to_api uses locally generated JWT token."""
-        self.config.bfa_secret_key = "test-secret-key"
+        self.config = replace(self.config, bfa_secret_key="test-secret-key")
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -644,8 +640,7 @@ class TestApiPoster(unittest.TestCase):
     @patch.object(ApiPoster, '_fetch_token_from_bfa_server')
     def test_post_to_api_with_bfa_server_token(self, mock_fetch_token, mock_post):
         """Test _post_to_api fetches token from BFA server when no secret key."""
-        self.config.bfa_host = "bfa-server.example.com"
-        self.config.bfa_secret_key = None
+        self.config = replace(self.config, bfa_host="bfa-server.example.com", bfa_secret_key=None)
 
         mock_fetch_token.return_value = "fetched-token-456"
 
@@ -668,8 +663,7 @@ class TestApiPoster(unittest.TestCase):
     @patch('requests.post')
     def test_post_to_api_with_raw_secret_key_fallback(self, mock_post):
         """Test _post_to_api uses raw secret key when JWT generation fails."""
-        self.config.bfa_secret_key = "raw-secret"
-        self.config.bfa_host = None
+        self.config = replace(self.config, bfa_secret_key="raw-secret", bfa_host=None)
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -691,8 +685,7 @@ class TestApiPoster(unittest.TestCase):
     @patch('requests.post')
     def test_post_to_api_without_authentication(self, mock_post):
         """Test _post_to_api proceeds without auth when nothing is configured."""
-        self.config.bfa_secret_key = None
-        self.config.bfa_host = None
+        self.config = replace(self.config, bfa_secret_key=None, bfa_host=None)
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -794,7 +787,7 @@ class TestApiPoster(unittest.TestCase):
 
     def test_post_jenkins_logs_when_api_disabled(self):
         """Test Jenkins logs posting when API is disabled."""
-        self.config.api_post_enabled = False
+        self.config = replace(self.config, api_post_enabled=False)
 
         jenkins_payload = {
             "source": "jenkins",
@@ -809,7 +802,7 @@ class TestApiPoster(unittest.TestCase):
 
     def test_post_jenkins_logs_without_url_configured(self):
         """Test Jenkins logs posting when API URL is not configured."""
-        self.config.api_post_url = None
+        self.config = replace(self.config, api_post_url=None)
 
         jenkins_payload = {
             "source": "jenkins",
@@ -880,7 +873,7 @@ class TestApiPoster(unittest.TestCase):
     @patch('requests.post')
     def test_post_jenkins_logs_without_retry(self, mock_post):
         """Test Jenkins logs posting with retry disabled."""
-        self.config.api_post_retry_enabled = False
+        self.config = replace(self.config, api_post_retry_enabled=False)
 
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -899,6 +892,31 @@ class TestApiPoster(unittest.TestCase):
 
         self.assertTrue(result)
 
+    @patch('requests.post')
+    def test_post_jenkins_logs_logs_api_request_once(self, mock_post):
+        """Test Jenkins logs posting records exactly one API log entry."""
+        self.config = replace(self.config, api_post_retry_enabled=False)
+        mock_post.side_effect = requests.exceptions.ConnectionError("Network error")
+
+        jenkins_payload = {
+            "source": "jenkins",
+            "job_name": "failing-job",
+            "build_number": 99
+        }
+
+        poster = ApiPoster(self.config)
+        with patch.object(poster, '_log_api_request') as mock_log:
+            result = poster.post_jenkins_logs(jenkins_payload)
+
+        self.assertFalse(result)
+        mock_log.assert_called_once()
+        kwargs = mock_log.call_args.kwargs
+        self.assertEqual(kwargs['pipeline_id'], 99)
+        self.assertEqual(kwargs['project_id'], 0)
+        self.assertIsNone(kwargs['status_code'])
+        self.assertIn("Network error", kwargs['error'])
+        self.assertGreaterEqual(kwargs['duration_ms'], 0)
+
     def test_post_pipeline_logs_payload_formatting_failure(self):
         """Test pipeline logs posting when payload formatting fails."""
         poster = ApiPoster(self.config)
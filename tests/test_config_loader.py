@@ -17,13 +17,15 @@ Comprehensive test coverage for configuration loading and validation including:
 
 import unittest
 import os
+from unittest.mock import patch
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
 import sys
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config_loader import ConfigLoader
+from src.config_loader import ConfigLoader, _DEFAULT_ADAPTIVE_THRESHOLDS, _DEFAULT_ADAPTIVE_THRESHOLDS_STR
 
 
 class TestConfigLoader(unittest.TestCase):
@@ -48,7 +50,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertEqual(config.gitlab_url, 'https://gitlab.example.com')
         self.assertEqual(config.gitlab_token, 'glpat-1234567890')
@@ -63,7 +65,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('GITLAB_URL', str(context.exception))
 
@@ -72,7 +74,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('GITLAB_TOKEN', str(context.exception))
 
@@ -81,7 +83,16 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com/'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
+
+        self.assertEqual(config.gitlab_url, 'https://gitlab.example.com')
+
+    def test_gitlab_url_multiple_trailing_slashes_removed(self):
+        """Test that repeated trailing slashes are all removed from GitLab URL."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com//'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+
+        config = ConfigLoader.reload()
 
         self.assertEqual(config.gitlab_url, 'https://gitlab.example.com')
 
@@ -91,7 +102,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
         os.environ['WEBHOOK_PORT'] = '9000'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertEqual(config.webhook_port, 9000)
 
@@ -102,7 +113,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['WEBHOOK_PORT'] = '0'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('WEBHOOK_PORT', str(context.exception))
         self.assertIn('between 1 and 65535', str(context.exception))
@@ -114,10 +125,22 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['WEBHOOK_PORT'] = '65536'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('WEBHOOK_PORT', str(context.exception))
 
+    def test_integer_setting_not_a_number(self):
+        """Test that a non-numeric integer setting names the offending variable."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+        os.environ['RETRY_ATTEMPTS'] = 'three'
+
+        with self.assertRaises(ValueError) as context:
+            ConfigLoader.reload()
+
+        self.assertIn('RETRY_ATTEMPTS', str(context.exception))
+        self.assertIn('Must be an integer', str(context.exception))
+
     def test_log_level_valid_values(self):
         """Test valid log level values."""
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
@@ -125,7 +148,7 @@ class TestConfigLoader(unittest.TestCase):
 
         for level in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
             os.environ['LOG_LEVEL'] = level
-            config = ConfigLoader.load()
+            config = ConfigLoader.reload()
             self.assertEqual(config.log_level, level)
 
     def test_log_level_case_insensitive(self):
@@ -134,7 +157,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
         os.environ['LOG_LEVEL'] = 'debug'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertEqual(config.log_level, 'DEBUG')
 
@@ -145,7 +168,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['LOG_LEVEL'] = 'INVALID'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('LOG_LEVEL', str(context.exception))
 
@@ -155,18 +178,18 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
         os.environ['LOG_SAVE_PIPELINE_STATUS'] = 'failed,canceled,skipped'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
-        self.assertEqual(config.log_save_pipeline_status, ['failed', 'canceled', 'skipped'])
+        self.assertEqual(config.log_save_pipeline_status, frozenset({'failed', 'canceled', 'skipped'}))
 
     def test_log_save_pipeline_status_default(self):
         """Test default value for pipeline status filter."""
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
-        self.assertEqual(config.log_save_pipeline_status, ['all'])
+        self.assertEqual(config.log_save_pipeline_status, frozenset({'all'}))
 
     def test_log_save_projects_parsing(self):
         """Test parsing of project ID whitelist."""
@@ -174,9 +197,9 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
         os.environ['LOG_SAVE_PROJECTS'] = '123,456,789'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
-        self.assertEqual(config.log_save_projects, ['123', '456', '789'])
+        self.assertEqual(config.log_save_projects, frozenset({'123', '456', '789'}))
 
     def test_log_exclude_projects_parsing(self):
         """Test parsing of project ID blacklist."""
@@ -184,9 +207,9 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
         os.environ['LOG_EXCLUDE_PROJECTS'] = '999,888'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
-        self.assertEqual(config.log_exclude_projects, ['999', '888'])
+        self.assertEqual(config.log_exclude_projects, frozenset({'999', '888'}))
 
     def test_log_save_metadata_always_boolean_parsing(self):
         """Test boolean parsing for log_save_metadata_always."""
@@ -196,13 +219,13 @@ class TestConfigLoader(unittest.TestCase):
         # Test truthy values
         for value in ['true', '1', 'yes', 'on', 'TRUE', 'Yes', 'ON']:
             os.environ['LOG_SAVE_METADATA_ALWAYS'] = value
-            config = ConfigLoader.load()
+            config = ConfigLoader.reload()
             self.assertTrue(config.log_save_metadata_always, f"Failed for value: {value}")
 
         # Test falsy values
         for value in ['false', '0', 'no', 'off', 'FALSE', 'No']:
             os.environ['LOG_SAVE_METADATA_ALWAYS'] = value
-            config = ConfigLoader.load()
+            config = ConfigLoader.reload()
             self.assertFalse(config.log_save_metadata_always, f"Failed for value: {value}")
 
     def test_api_post_enabled_default(self):
@@ -210,7 +233,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertFalse(config.api_post_enabled)
 
@@ -221,7 +244,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['API_POST_ENABLED'] = 'true'
         os.environ['BFA_HOST'] = 'bfa-server.example.com'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertTrue(config.api_post_enabled)
         self.assertEqual(config.bfa_host, 'bfa-server.example.com')
@@ -234,7 +257,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['API_POST_ENABLED'] = 'true'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('BFA_HOST', str(context.exception))
 
@@ -248,18 +271,18 @@ class TestConfigLoader(unittest.TestCase):
         # Test invalid timeout (too low)
         os.environ['API_POST_TIMEOUT'] = '0'
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
         self.assertIn('API_POST_TIMEOUT', str(context.exception))
 
         # Test invalid timeout (too high)
         os.environ['API_POST_TIMEOUT'] = '301'
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
         self.assertIn('API_POST_TIMEOUT', str(context.exception))
 
         # Test valid timeout
         os.environ['API_POST_TIMEOUT'] = '60'
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
         self.assertEqual(config.api_post_timeout, 60)
 
     def test_jenkins_disabled_by_default(self):
@@ -267,7 +290,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertFalse(config.jenkins_enabled)
 
@@ -280,7 +303,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['JENKINS_USER'] = 'jenkins-user'
         os.environ['JENKINS_API_TOKEN'] = 'jenkins-token-123'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertTrue(config.jenkins_enabled)
         self.assertEqual(config.jenkins_url, 'https://jenkins1.example.com')  # Trailing slash removed
@@ -294,7 +317,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['JENKINS_ENABLED'] = 'true'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('JENKINS_URL', str(context.exception))
 
@@ -308,7 +331,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['JENKINS_API_TOKEN'] = 'token'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('JENKINS_URL', str(context.exception))
         self.assertIn('http://', str(context.exception))
@@ -321,7 +344,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['JENKINS_URL'] = 'https://jenkins1.example.com'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('JENKINS_USER', str(context.exception))
 
@@ -334,7 +357,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['JENKINS_USER'] = 'jenkins-user'
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         self.assertIn('JENKINS_API_TOKEN', str(context.exception))
 
@@ -345,7 +368,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['ERROR_CONTEXT_LINES_BEFORE'] = '100'
         os.environ['ERROR_CONTEXT_LINES_AFTER'] = '20'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertEqual(config.error_context_lines_before, 100)
         self.assertEqual(config.error_context_lines_after, 20)
@@ -355,7 +378,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertEqual(config.error_context_lines_before, 50)
         self.assertEqual(config.error_context_lines_after, 10)
@@ -365,17 +388,39 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
         result = ConfigLoader.validate(config)
 
         self.assertTrue(result)
 
-    def test_validate_invalid_gitlab_url_protocol(self):
-        """Test validation fails for invalid GitLab URL protocol."""
+    def test_load_invalid_gitlab_url_protocol(self):
+        """Test loading fails for invalid GitLab URL protocol."""
         os.environ['GITLAB_URL'] = 'ftp://git.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        with self.assertRaises(ValueError) as context:
+            ConfigLoader.reload()
+
+        self.assertIn('GITLAB_URL', str(context.exception))
+        self.assertIn('http://', str(context.exception))
+
+    def test_load_short_gitlab_token(self):
+        """Test loading fails for too short GitLab token."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'short'
+
+        with self.assertRaises(ValueError) as context:
+            ConfigLoader.reload()
+
+        self.assertIn('GITLAB_TOKEN', str(context.exception))
+        self.assertIn('too short', str(context.exception))
+
+    def test_validate_invalid_gitlab_url_protocol(self):
+        """Test validation fails for a hand-built config with invalid GitLab URL protocol."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+
+        config = replace(ConfigLoader.reload(), gitlab_url='ftp://git.example.com')
 
         with self.assertRaises(ValueError) as context:
             ConfigLoader.validate(config)
@@ -384,11 +429,11 @@ class TestConfigLoader(unittest.TestCase):
         self.assertIn('http://', str(context.exception))
 
     def test_validate_short_gitlab_token(self):
-        """Test validation fails for too short GitLab token."""
+        """Test validation fails for a hand-built config with too short GitLab token."""
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
-        os.environ['GITLAB_TOKEN'] = 'short'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = replace(ConfigLoader.reload(), gitlab_token='short')
 
         with self.assertRaises(ValueError) as context:
             ConfigLoader.validate(config)
@@ -403,7 +448,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['RETRY_ATTEMPTS'] = '5'
         os.environ['RETRY_DELAY'] = '10'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertEqual(config.retry_attempts, 5)
         self.assertEqual(config.retry_delay, 10)
@@ -413,13 +458,13 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertIsNone(config.webhook_secret)
 
         # Test with secret
         os.environ['WEBHOOK_SECRET'] = 'my-secret-123'
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertEqual(config.webhook_secret, 'my-secret-123')
 
@@ -428,7 +473,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertIsNone(config.bfa_secret_key)
 
@@ -437,20 +482,46 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
+
+        self.assertIsNone(config.api_post_url)
+
+    def test_api_post_url_none_when_api_post_disabled(self):
+        """Test that API POST URL is not constructed while API posting is disabled."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+        os.environ['BFA_HOST'] = 'bfa-server.example.com'
+
+        config = ConfigLoader.reload()
 
+        self.assertEqual(config.bfa_host, 'bfa-server.example.com')
         self.assertIsNone(config.api_post_url)
 
+    def test_jenkins_settings_ignored_when_disabled(self):
+        """Test that Jenkins connection settings are not read while Jenkins is disabled."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+        os.environ['JENKINS_URL'] = 'https://jenkins.example.com'
+        os.environ['JENKINS_USER'] = 'jenkins'
+        os.environ['JENKINS_API_TOKEN'] = 'token123'
+
+        config = ConfigLoader.reload()
+
+        self.assertFalse(config.jenkins_enabled)
+        self.assertIsNone(config.jenkins_url)
+        self.assertIsNone(config.jenkins_user)
+        self.assertIsNone(config.jenkins_api_token)
+
     def test_list_parsing_with_spaces(self):
         """Test that list parsing handles spaces correctly."""
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
         os.environ['LOG_SAVE_PIPELINE_STATUS'] = 'failed , canceled , skipped'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         # Spaces should be stripped
-        self.assertEqual(config.log_save_pipeline_status, ['failed', 'canceled', 'skipped'])
+        self.assertEqual(config.log_save_pipeline_status, frozenset({'failed', 'canceled', 'skipped'}))
 
     def test_list_parsing_empty_string(self):
         """Test that empty string results in empty list."""
@@ -458,16 +529,16 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
         os.environ['LOG_SAVE_PROJECTS'] = ''
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
-        self.assertEqual(config.log_save_projects, [])
+        self.assertEqual(config.log_save_projects, frozenset())
 
     def test_api_post_retry_enabled_default(self):
         """Test API POST retry is enabled by default."""
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertTrue(config.api_post_retry_enabled)
 
@@ -476,7 +547,7 @@ class TestConfigLoader(unittest.TestCase):
         os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
         os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
 
-        config = ConfigLoader.load()
+        config = ConfigLoader.reload()
 
         self.assertFalse(config.api_post_save_to_file)
 
@@ -506,7 +577,7 @@ class TestConfigLoader(unittest.TestCase):
             # Note: NOT setting JENKINS_URL, JENKINS_USER, JENKINS_API_TOKEN
 
             # Should not raise error because jenkins_instances.json exists
-            config = ConfigLoader.load()
+            config = ConfigLoader.reload()
 
             self.assertTrue(config.jenkins_enabled)
             # .env credentials should be None/empty
@@ -531,13 +602,73 @@ class TestConfigLoader(unittest.TestCase):
         # Not setting JENKINS_URL, JENKINS_USER, JENKINS_API_TOKEN
 
         with self.assertRaises(ValueError) as context:
-            ConfigLoader.load()
+            ConfigLoader.reload()
 
         # Error message should mention both .env and jenkins_instances.json
         error_msg = str(context.exception)
         self.assertIn('JENKINS_URL', error_msg)
         self.assertIn('jenkins_instances.json', error_msg)
 
+    def test_load_returns_cached_config(self):
+        """Test that load() parses the environment once and reuses the result."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+
+        config = ConfigLoader.reload()
+        os.environ['WEBHOOK_PORT'] = '9000'
+
+        self.assertIs(ConfigLoader.load(), config)
+        self.assertEqual(ConfigLoader.load().webhook_port, 8000)
+
+    def test_reload_picks_up_environment_changes(self):
+        """Test that reload() discards the cached config."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+
+        first = ConfigLoader.reload()
+        os.environ['WEBHOOK_PORT'] = '9000'
+        second = ConfigLoader.reload()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.webhook_port, 9000)
+        self.assertIs(ConfigLoader.load(), second)
+
+    def test_group_loaders_read_one_environment_snapshot(self):
+        """Test an environment change during loading does not reach later group loaders."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+        load_basic_settings = ConfigLoader._load_basic_settings
+
+        def change_env_midway(env):
+            os.environ['API_POST_TIMEOUT'] = '45'
+            return load_basic_settings(env)
+
+        with patch.object(ConfigLoader, '_load_basic_settings', side_effect=change_env_midway):
+            config = ConfigLoader.reload()
+
+        self.assertEqual(config.api_post_timeout, 30)
+
+    def test_config_is_read_only(self):
+        """Test that the loaded Config cannot be mutated."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+
+        config = ConfigLoader.reload()
+
+        with self.assertRaises(FrozenInstanceError):
+            config.webhook_port = 9000
+
+    def test_config_is_hashable(self):
+        """Test that a loaded Config can be used as a cache key."""
+        os.environ['GITLAB_URL'] = 'https://gitlab.example.com'
+        os.environ['GITLAB_TOKEN'] = 'glpat-1234567890'
+        os.environ['LOG_SAVE_PROJECTS'] = '123,456'
+
+        config = ConfigLoader.reload()
+
+        self.assertEqual(hash(config), hash(replace(config)))
+        self.assertEqual({config: 'cached'}[ConfigLoader.reload()], 'cached')
+
 
 class TestConfigLoaderHelpers(unittest.TestCase):
     """Test cases for ConfigLoader helper methods."""
@@ -568,6 +699,17 @@ class TestConfigLoaderHelpers(unittest.TestCase):
         self.assertEqual(result['retry_delay'], 2)
         self.assertEqual(result['log_level'], 'INFO')
 
+    def test_filter_values_are_interned(self):
+        """Test that status values and log level are interned strings."""
+        os.environ['LOG_LEVEL'] = 'debug'
+        os.environ['LOG_SAVE_PIPELINE_STATUS'] = ' Failed , canceled'
+
+        basic = ConfigLoader._load_basic_settings()
+        filtering = ConfigLoader._load_log_filtering()
+
+        self.assertIs(basic['log_level'], sys.intern('DEBUG'))
+        self.assertIs(min(filtering['log_save_pipeline_status']), sys.intern('canceled'))
+
     def test_load_basic_settings_with_custom_values(self):
         """Test _load_basic_settings with custom environment variables."""
         os.environ['WEBHOOK_PORT'] = '9000'
@@ -590,10 +732,10 @@ class TestConfigLoaderHelpers(unittest.TestCase):
         """Test _load_log_filtering with default values."""
         result = ConfigLoader._load_log_filtering()
 
-        self.assertEqual(result['log_save_pipeline_status'], ['all'])
-        self.assertEqual(result['log_save_projects'], [])
-        self.assertEqual(result['log_exclude_projects'], [])
-        self.assertEqual(result['log_save_job_status'], ['all'])
+        self.assertEqual(result['log_save_pipeline_status'], frozenset({'all'}))
+        self.assertEqual(result['log_save_projects'], frozenset())
+        self.assertEqual(result['log_exclude_projects'], frozenset())
+        self.assertEqual(result['log_save_job_status'], frozenset({'all'}))
         self.assertTrue(result['log_save_metadata_always'])
 
     def test_load_log_filtering_with_custom_values(self):
@@ -606,10 +748,10 @@ class TestConfigLoaderHelpers(unittest.TestCase):
 
         result = ConfigLoader._load_log_filtering()
 
-        self.assertEqual(result['log_save_pipeline_status'], ['failed', 'success'])
-        self.assertEqual(result['log_save_projects'], ['project1', 'project2'])
-        self.assertEqual(result['log_exclude_projects'], ['test-project'])
-        self.assertEqual(result['log_save_job_status'], ['failed'])
+        self.assertEqual(result['log_save_pipeline_status'], frozenset({'failed', 'success'}))
+        self.assertEqual(result['log_save_projects'], frozenset({'project1', 'project2'}))
+        self.assertEqual(result['log_exclude_projects'], frozenset({'test-project'}))
+        self.assertEqual(result['log_save_job_status'], frozenset({'failed'}))
         self.assertFalse(result['log_save_metadata_always'])
 
     def test_load_api_config_with_defaults(self):
@@ -635,6 +777,18 @@ class TestConfigLoaderHelpers(unittest.TestCase):
         self.assertFalse(result['api_post_retry_enabled'])
         self.assertTrue(result['api_post_save_to_file'])
 
+    def test_load_api_config_disabled_skips_timeout_range(self):
+        """Test the timeout range is only enforced when API posting is enabled."""
+        result = ConfigLoader._load_api_config({'API_POST_ENABLED': 'false', 'API_POST_TIMEOUT': '0'})
+        self.assertEqual(result['api_post_timeout'], 0)
+
+        # Still has to be an integer
+        with self.assertRaises(ValueError):
+            ConfigLoader._load_api_config({'API_POST_ENABLED': 'false', 'API_POST_TIMEOUT': 'soon'})
+
+        with self.assertRaises(ValueError):
+            ConfigLoader._load_api_config({'API_POST_ENABLED': 'true', 'API_POST_TIMEOUT': '0'})
+
     def test_load_jenkins_config_disabled(self):
         """Test _load_jenkins_config when Jenkins is disabled."""
         result = ConfigLoader._load_jenkins_config()
@@ -668,7 +822,6 @@ class TestConfigLoaderHelpers(unittest.TestCase):
 
         self.assertIsNone(result['bfa_host'])
         self.assertIsNone(result['bfa_secret_key'])
-        self.assertIsNone(result['api_post_url'])
 
     def test_load_bfa_config_with_host(self):
         """Test _load_bfa_config with BFA host configured."""
@@ -679,8 +832,31 @@ class TestConfigLoaderHelpers(unittest.TestCase):
 
         self.assertEqual(result['bfa_host'], '192.168.1.100')
         self.assertEqual(result['bfa_secret_key'], 'secret_key_123')
-        # API URL should be auto-constructed
-        self.assertEqual(result['api_post_url'], 'http://192.168.1.100:8000/api/analyze')
+
+    def test_is_http_url(self):
+        """Test _is_http_url accepts only http:// and https:// URLs."""
+        from src.config_loader import _is_http_url
+
+        self.assertTrue(_is_http_url('http://gitlab.example.com'))
+        self.assertTrue(_is_http_url('https://gitlab.example.com'))
+        self.assertFalse(_is_http_url('ftp://gitlab.example.com'))
+        self.assertFalse(_is_http_url('https:/gitlab.example.com'))
+        self.assertFalse(_is_http_url(''))
+
+    def test_envbool_parsing(self):
+        """Test _envbool accepts all truthy spellings and ignores surrounding whitespace."""
+        from src.config_loader import _envbool
+
+        for value in ['true', '1', 'yes', 'on', ' TRUE ', 'On']:
+            os.environ['ERROR_ADAPTIVE_CONTEXT_ENABLED'] = value
+            self.assertTrue(_envbool(os.environ, 'ERROR_ADAPTIVE_CONTEXT_ENABLED', 'false'), f"Failed for: {value}")
+
+        for value in ['false', '0', 'no', 'off', '']:
+            os.environ['ERROR_ADAPTIVE_CONTEXT_ENABLED'] = value
+            self.assertFalse(_envbool(os.environ, 'ERROR_ADAPTIVE_CONTEXT_ENABLED', 'true'), f"Failed for: {value}")
+
+        del os.environ['ERROR_ADAPTIVE_CONTEXT_ENABLED']
+        self.assertTrue(_envbool(os.environ, 'ERROR_ADAPTIVE_CONTEXT_ENABLED', 'true'))
 
     def test_load_log_limits_with_defaults(self):
         """Test _load_log_limits with default values."""
@@ -708,6 +884,30 @@ class TestConfigLoaderHelpers(unittest.TestCase):
         self.assertEqual(result['tail_log_lines'], 10000)
         self.assertEqual(result['stream_chunk_size'], 16384)
 
+    def test_load_log_limits_skips_thresholds_when_adaptive_disabled(self):
+        """Test that adaptive thresholds are not parsed when adaptive context is disabled."""
+        os.environ['ERROR_ADAPTIVE_CONTEXT_ENABLED'] = 'false'
+        os.environ['ERROR_ADAPTIVE_THRESHOLDS'] = 'not-a-threshold'
+
+        result = ConfigLoader._load_log_limits()
+
+        self.assertFalse(result['error_adaptive_context_enabled'])
+        self.assertEqual(result['error_adaptive_thresholds'], ((50, 50, 10), (100, 10, 5), (150, 5, 2)))
+
+    def test_default_adaptive_thresholds_match_default_string(self):
+        """Test that the precomputed default thresholds equal the parsed default string."""
+        parsed = ConfigLoader._parse_adaptive_thresholds(_DEFAULT_ADAPTIVE_THRESHOLDS_STR)
+
+        self.assertEqual(tuple(parsed), _DEFAULT_ADAPTIVE_THRESHOLDS)
+
+    def test_load_log_limits_default_thresholds_not_parsed(self):
+        """Test that the default thresholds are used without parsing when the variable is unset."""
+        with patch.object(ConfigLoader, '_parse_adaptive_thresholds') as mock_parse:
+            result = ConfigLoader._load_log_limits()
+
+        mock_parse.assert_not_called()
+        self.assertIs(result['error_adaptive_thresholds'], _DEFAULT_ADAPTIVE_THRESHOLDS)
+
     def test_decode_if_base64_with_base64(self):
         """Test _decode_if_base64 with base64 encoding."""
         import base64
@@ -2,9 +2,15 @@
 Tests for Error Handler Module
 """
 
+import asyncio
+import random
+import threading
 import unittest
 import time
-from src.error_handler import ErrorHandler, RetryExhaustedError, retry_on_failure, CircuitBreaker
+from unittest.mock import patch
+from src.error_handler import (
+    ErrorHandler, RetryExhaustedError, retry_on_failure, CircuitBreaker, CircuitBreakerError
+)
 
 
 class TestErrorHandler(unittest.TestCase):
@@ -47,9 +53,38 @@ class TestErrorHandler(unittest.TestCase):
 
         self.assertEqual(context.exception.attempts, 3)  # max_retries + 1
 
+    @patch('src.error_handler.time.sleep')
+    def test_no_sleep_after_final_attempt(self, mock_sleep):
+        """Test that no backoff is paid once retries are exhausted."""
+        handler = ErrorHandler(max_retries=2, base_delay=1.0, jitter=False)
+
+        def always_fails():
+            raise ValueError("Always fails")
+
+        with patch.object(ErrorHandler, '_calculate_delay', autospec=True,
+                          side_effect=ErrorHandler._calculate_delay) as mock_delay:
+            with self.assertRaises(RetryExhaustedError):
+                handler.retry_with_backoff(always_fails)
+
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(mock_delay.call_count, 2)
+
+    @patch('src.error_handler.time.sleep')
+    def test_zero_delay_skips_sleep(self, mock_sleep):
+        """Test that a zero delay does not call time.sleep."""
+        handler = ErrorHandler(max_retries=2, base_delay=0.0)
+
+        def always_fails():
+            raise ValueError("Always fails")
+
+        with self.assertRaises(RetryExhaustedError):
+            handler.retry_with_backoff(always_fails)
+
+        mock_sleep.assert_not_called()
+
     def test_exponential_backoff(self):
         """Test that exponential backoff increases delay correctly."""
-        handler = ErrorHandler(max_retries=3, base_delay=1.0, exponential=True)
+        handler = ErrorHandler(max_retries=3, base_delay=1.0, exponential=True, jitter=False)
 
         delays = [
             handler._calculate_delay(0),  # 1.0
@@ -61,7 +96,7 @@ class TestErrorHandler(unittest.TestCase):
 
     def test_constant_delay(self):
         """Test that constant delay remains the same."""
-        handler = ErrorHandler(max_retries=3, base_delay=2.0, exponential=False)
+        handler = ErrorHandler(max_retries=3, base_delay=2.0, exponential=False, jitter=False)
 
         delays = [
             handler._calculate_delay(0),
@@ -71,6 +106,46 @@ class TestErrorHandler(unittest.TestCase):
 
         self.assertEqual(delays, [2.0, 2.0, 2.0])
 
+    def test_max_delay_caps_exponential_growth(self):
+        """Test that exponential delays are clamped to max_delay."""
+        handler = ErrorHandler(max_retries=10, base_delay=2.0, jitter=False, max_delay=30.0)
+
+        self.assertEqual(handler._calculate_delay(3), 16.0)
+        self.assertEqual(handler._calculate_delay(4), 30.0)
+        self.assertEqual(handler._calculate_delay(9), 30.0)
+
+    def test_max_delay_applies_before_jitter(self):
+        """Test that jittered delays never exceed max_delay."""
+        handler = ErrorHandler(base_delay=2.0, max_delay=5.0, rng=random.Random(3))
+
+        for _ in range(50):
+            self.assertLessEqual(handler._calculate_delay(8), 5.0)
+
+    def test_instances_use_slots(self):
+        """Test that handler and breaker instances carry no per-instance __dict__."""
+        self.assertFalse(hasattr(ErrorHandler(), '__dict__'))
+        self.assertFalse(hasattr(CircuitBreaker(), '__dict__'))
+
+    def test_full_jitter_stays_within_ceiling(self):
+        """Test that jittered delays fall between 0 and the backoff ceiling."""
+        handler = ErrorHandler(max_retries=3, base_delay=1.0, rng=random.Random(42))
+
+        for attempt in range(3):
+            for _ in range(50):
+                delay = handler._calculate_delay(attempt)
+                self.assertGreaterEqual(delay, 0.0)
+                self.assertLessEqual(delay, 2 ** attempt)
+
+    def test_full_jitter_is_reproducible_with_seed(self):
+        """Test that a seeded random source gives repeatable delays."""
+        first = ErrorHandler(base_delay=1.0, rng=random.Random(7))
+        second = ErrorHandler(base_delay=1.0, rng=random.Random(7))
+
+        self.assertEqual(
+            [first._calculate_delay(i) for i in range(4)],
+            [second._calculate_delay(i) for i in range(4)]
+        )
+
     def test_specific_exception_only(self):
         """Test that only specified exceptions are retried."""
         handler = ErrorHandler(max_retries=3, base_delay=0.1)
@@ -110,6 +185,89 @@ class TestRetryDecorator(unittest.TestCase):
         self.assertEqual(result, "success")
         self.assertGreaterEqual(attempts['count'], 2)
 
+    def test_decorator_builds_handler_once(self):
+        """Test the ErrorHandler is created at decoration time, not per call."""
+        with patch('src.error_handler.ErrorHandler', wraps=ErrorHandler) as mock_handler_cls:
+            @retry_on_failure(max_retries=1, base_delay=0.01)
+            def success_func(value):
+                return value
+
+            self.assertEqual(success_func(1), 1)
+            self.assertEqual(success_func(2), 2)
+
+        mock_handler_cls.assert_called_once()
+
+
+class TestAsyncRetry(unittest.TestCase):
+    """Test cases for the async retry path."""
+
+    def test_aretry_eventually_succeeds(self):
+        """Test aretry_with_backoff awaits the coroutine and retries."""
+        handler = ErrorHandler(max_retries=3, base_delay=0.01)
+        attempts = {'count': 0}
+
+        async def flaky():
+            attempts['count'] += 1
+            if attempts['count'] < 3:
+                raise ValueError("Not yet")
+            return "async success"
+
+        result = asyncio.run(handler.aretry_with_backoff(flaky, exceptions=(ValueError,)))
+        self.assertEqual(result, "async success")
+        self.assertEqual(attempts['count'], 3)
+
+    def test_aretry_exhausted(self):
+        """Test aretry_with_backoff raises RetryExhaustedError."""
+        handler = ErrorHandler(max_retries=1, base_delay=0.01)
+
+        async def always_fails():
+            raise ValueError("Always fails")
+
+        with self.assertRaises(RetryExhaustedError) as context:
+            asyncio.run(handler.aretry_with_backoff(always_fails))
+        self.assertEqual(context.exception.attempts, 2)
+
+    def test_aretry_does_not_block_event_loop(self):
+        """Test other tasks run while a retry is backing off."""
+        # Fixed 50ms backoff, well above the ticker's 10ms, so the order is deterministic
+        handler = ErrorHandler(max_retries=1, base_delay=0.05, exponential=False, jitter=False)
+        events = []
+
+        async def fails_once():
+            if not events:
+                events.append('fail')
+                raise ValueError("Not yet")
+            events.append('done')
+            return "done"
+
+        async def ticker():
+            await asyncio.sleep(0.01)
+            events.append('tick')
+
+        async def main():
+            return await asyncio.gather(handler.aretry_with_backoff(fails_once), ticker())
+
+        result, _ = asyncio.run(main())
+        self.assertEqual(result, "done")
+        # A blocking time.sleep() would give ['fail', 'done', 'tick']
+        self.assertEqual(events, ['fail', 'tick', 'done'])
+
+    def test_decorator_on_coroutine_function(self):
+        """Test decorator returns an awaitable wrapper for coroutine functions."""
+        attempts = {'count': 0}
+
+        @retry_on_failure(max_retries=2, base_delay=0.01, exceptions=(ValueError,))
+        async def eventually_succeeds(value):
+            attempts['count'] += 1
+            if attempts['count'] < 2:
+                raise ValueError("Not yet")
+            return value
+
+        self.assertTrue(asyncio.iscoroutinefunction(eventually_succeeds))
+        self.assertEqual(asyncio.run(eventually_succeeds("ok")), "ok")
+        self.assertEqual(attempts['count'], 2)
+        self.assertEqual(eventually_succeeds.__name__, 'eventually_succeeds')
+
 
 class TestCircuitBreaker(unittest.TestCase):
     """Test cases for CircuitBreaker class."""
@@ -230,6 +388,107 @@ class TestCircuitBreaker(unittest.TestCase):
         # Should be OPEN again
         self.assertEqual(breaker.state, "OPEN")
 
+    def test_concurrent_failures_counted_exactly(self):
+        """Test that concurrent failures are not lost to racing updates."""
+        breaker = CircuitBreaker(failure_threshold=10000, recovery_timeout=60.0)
+        start = threading.Barrier(8)
+
+        def always_fails():
+            raise ValueError("Failed")
+
+        def worker():
+            start.wait()
+            for _ in range(100):
+                try:
+                    breaker.call(always_fails)
+                except ValueError:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(breaker.failure_count, 800)
+        self.assertEqual(breaker.state, "CLOSED")
+
+    def test_unexpected_exceptions_do_not_trip(self):
+        """Test that exceptions outside expected_exceptions bypass the counters."""
+        breaker = CircuitBreaker(failure_threshold=1, expected_exceptions=(ConnectionError,))
+
+        def buggy():
+            raise KeyError("bug")
+
+        with self.assertRaises(KeyError):
+            breaker.call(buggy)
+
+        self.assertEqual(breaker.failure_count, 0)
+        self.assertEqual(breaker.state, "CLOSED")
+
+    def test_reraise_preserves_traceback(self):
+        """Test that the original traceback reaches the caller."""
+        breaker = CircuitBreaker(failure_threshold=5)
+
+        def failing_inner():
+            raise ValueError("Failed")
+
+        try:
+            breaker.call(failing_inner)
+            self.fail("ValueError not raised")
+        except ValueError as error:
+            tb = error.__traceback__
+
+        frames = []
+        while tb is not None:
+            frames.append(tb.tb_frame.f_code.co_name)
+            tb = tb.tb_next
+        self.assertEqual(frames[-1], 'failing_inner')
+        self.assertEqual(breaker.failure_count, 1)
+
+    def test_acall_trips_and_recovers(self):
+        """Test the async call path shares state with the sync breaker."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+
+        async def always_fails():
+            raise ValueError("Failed")
+
+        async def always_succeeds():
+            return "success"
+
+        async def scenario():
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    await breaker.acall(always_fails)
+            self.assertEqual(breaker.state, "OPEN")
+            with self.assertRaises(CircuitBreakerError):
+                await breaker.acall(always_succeeds)
+            await asyncio.sleep(0.06)
+            return await breaker.acall(always_succeeds)
+
+        self.assertEqual(asyncio.run(scenario()), "success")
+        self.assertEqual(breaker.state, "CLOSED")
+
+    @patch('src.error_handler.time.monotonic')
+    def test_recovery_uses_monotonic_clock(self, mock_monotonic):
+        """Test that recovery timing is driven by time.monotonic()."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+
+        def always_fails():
+            raise ValueError("Failed")
+
+        mock_monotonic.return_value = 100.0
+        with self.assertRaises(ValueError):
+            breaker.call(always_fails)
+
+        mock_monotonic.return_value = 105.0
+        with self.assertRaises(CircuitBreakerError):
+            breaker.call(always_fails)
+
+        mock_monotonic.return_value = 110.0
+        self.assertEqual(breaker.call(lambda: "ok"), "ok")
+        self.assertEqual(breaker.state, "CLOSED")
+
 
 class TestErrorHandlerEdgeCases(unittest.TestCase):
     """Test edge cases for ErrorHandler."""
@@ -244,6 +503,33 @@ class TestErrorHandlerEdgeCases(unittest.TestCase):
         with self.assertRaises(RetryExhaustedError):
             handler.retry_with_backoff(fails, exceptions=(ValueError,))
 
+    def test_decorator_zero_retries_single_attempt(self):
+        """Test decorator with zero retries calls once and still raises RetryExhaustedError."""
+        attempts = {'count': 0}
+
+        @retry_on_failure(max_retries=0, exceptions=(ValueError,))
+        def fails():
+            attempts['count'] += 1
+            raise ValueError("Failed")
+
+        with patch.object(ErrorHandler, 'retry_with_backoff') as mock_retry:
+            with self.assertRaises(RetryExhaustedError) as context:
+                fails()
+
+        mock_retry.assert_not_called()
+        self.assertEqual(attempts['count'], 1)
+        self.assertEqual(context.exception.attempts, 1)
+        self.assertIsInstance(context.exception.last_exception, ValueError)
+
+    def test_decorator_zero_retries_other_exceptions_propagate(self):
+        """Test decorator with zero retries lets unlisted exceptions through unchanged."""
+        @retry_on_failure(max_retries=0, exceptions=(ValueError,))
+        def fails():
+            raise KeyError("bug")
+
+        with self.assertRaises(KeyError):
+            fails()
+
     def test_with_args_and_kwargs(self):
         """Test retry with function arguments."""
         handler = ErrorHandler(max_retries=2, base_delay=0.1)
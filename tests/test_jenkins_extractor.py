@@ -3,6 +3,7 @@ Unit tests for jenkins_extractor module.
 """
 
 import unittest
+from unittest.mock import patch
 
 from src.jenkins_extractor import JenkinsExtractor
 
@@ -36,6 +37,23 @@ class TestJenkinsExtractor(unittest.TestCase):
         self.assertEqual(result['status'], 'SUCCESS')
         self.assertEqual(result['jenkins_url'], 'http://jenkins1.example.com')
 
+    def test_webhook_format_dispatch(self):
+        """Test each payload signature routes to its extractor, checked in order."""
+        formats = [
+            (('job_name', 'build_number'), '_extract_custom_format'),
+            (('job', 'build'), '_extract_generic_webhook_format'),
+            (('name', 'build'), '_extract_notification_format'),
+        ]
+        for required_keys, extractor_name in formats:
+            payload = {key: {} for key in required_keys}
+            with patch.object(JenkinsExtractor, extractor_name, return_value={'matched': extractor_name}):
+                self.assertEqual(self.extractor.extract_webhook_data(payload), {'matched': extractor_name})
+
+        # Custom format wins when a payload carries several signatures
+        payload = {'job_name': 'a', 'build_number': 1, 'job': {}, 'build': {}}
+        with patch.object(JenkinsExtractor, '_extract_custom_format', return_value={'matched': 'custom'}):
+            self.assertEqual(self.extractor.extract_webhook_data(payload), {'matched': 'custom'})
+
     def test_extract_webhook_data_custom_format_minimal(self):
         """Test custom format with minimal required fields."""
         payload = {
@@ -69,7 +87,7 @@ class TestJenkinsExtractor(unittest.TestCase):
         self.assertEqual(result['job_name'], 'my-pipeline')
         self.assertEqual(result['build_number'], 789)
         self.assertEqual(result['status'], 'FAILURE')
-        self.assertIn('jenkins_url', result)
+        self.assertEqual(result['jenkins_url'], 'http://jenkins1.example.com')
 
     def test_extract_webhook_data_notification_format(self):
         """Test extracting data from Notification plugin format."""
@@ -127,6 +145,29 @@ class TestJenkinsExtractor(unittest.TestCase):
         self.assertEqual(result['build_number'], 333)
         self.assertEqual(result['status'], 'SUCCESS')
         self.assertIn('timestamp', result)
+        self.assertTrue(result['timestamp'].endswith('+00:00'))
+
+    @patch('src.jenkins_extractor._now_iso')
+    def test_extract_custom_format_keeps_payload_timestamp(self, mock_now_iso):
+        """Test that a payload timestamp is used without generating one."""
+        payload = {'job_name': 'custom-job', 'build_number': 1, 'timestamp': '2024-01-01T12:00:00Z'}
+
+        result = self.extractor._extract_custom_format(payload)
+
+        self.assertEqual(result['timestamp'], '2024-01-01T12:00:00Z')
+        mock_now_iso.assert_not_called()
+
+    def test_extract_generic_webhook_format_jenkins_url_suffix(self):
+        """Test that only the '/job/<name>' suffix is removed from the job URL."""
+        cases = [
+            ('http://jenkins.example.com/job/build-job/', 'http://jenkins.example.com'),
+            ('http://ci.example.org/jenkins/job/build-job', 'http://ci.example.org/jenkins'),
+            ('http://ci.example.org/other/path', 'http://ci.example.org/other/path'),
+        ]
+        for url, expected in cases:
+            payload = {'job': {'name': 'build-job', 'url': url}, 'build': {'number': 1}}
+            result = self.extractor._extract_generic_webhook_format(payload)
+            self.assertEqual(result['jenkins_url'], expected, url)
 
     def test_extract_generic_webhook_format(self):
         """Test _extract_generic_webhook_format method."""
@@ -342,6 +383,43 @@ Testing B
 
         self.assertEqual(result, '')
 
+    def test_iter_lines_matches_split(self):
+        """Test lazy line iteration yields the same lines as str.split('\\n')."""
+        for text in ['', 'one line', 'a\nb\n', 'a\r\nb\rc\n\n', '\n']:
+            self.assertEqual(list(self.extractor._iter_lines(text)), text.split('\n'))
+
+    def test_index_log_lines(self):
+        """Test the one-pass marker index used for stage and block extraction."""
+        log_lines = [
+            "[Pipeline] stage (Build)",
+            "Compiling code",
+            "[Pipeline] // stage (Build)",
+            "[Pipeline] { (Unit Tests)",
+            "[Pipeline] }",
+        ]
+
+        index = self.extractor._index_log_lines(log_lines)
+
+        self.assertEqual(index['stage_start'], [0, 2])
+        self.assertEqual(index['stage_end'], [2])
+        self.assertEqual(index['block_start'], [3])
+        self.assertEqual(index['block_end'], [4])
+
+    def test_extract_stage_log_with_shared_index(self):
+        """Test extracting several stages from one precomputed index."""
+        log_lines = [
+            "[Pipeline] stage (Build)",
+            "Compiling code",
+            "[Pipeline] // stage",
+            "[Pipeline] stage (Test)",
+            "Running tests",
+            "[Pipeline] // stage",
+        ]
+        index = self.extractor._index_log_lines(log_lines)
+
+        self.assertEqual(self.extractor._extract_stage_log(log_lines, 'Build', index), "Compiling code")
+        self.assertEqual(self.extractor._extract_stage_log(log_lines, 'Test', index), "Running tests")
+
     def test_extract_block_log(self):
         """Test extracting log for a specific parallel block."""
         log_lines = [
@@ -403,6 +481,52 @@ Testing B
         self.assertIsNotNone(match)
         self.assertEqual(match.group(1), 'Unit Tests')
 
+    def test_pipeline_marker_pattern_kinds(self):
+        """Test the combined marker pattern reports which marker matched."""
+        pattern = self.extractor.PIPELINE_MARKER_PATTERN
+
+        self.assertEqual(pattern.search('[Pipeline] stage (Test)').lastgroup, 'stage')
+        self.assertEqual(pattern.search('[Pipeline] // stage (Test)').lastgroup, 'stage_end')
+        self.assertEqual(pattern.search('[Pipeline] parallel').lastgroup, 'parallel')
+        self.assertEqual(pattern.search('[Pipeline] // parallel').lastgroup, 'parallel_end')
+        match = pattern.search('[Pipeline] { (Unit Tests)')
+        self.assertEqual(match.lastgroup, 'branch')
+        self.assertEqual(match.group('branch_name'), 'Unit Tests')
+        self.assertIsNone(pattern.search('[Pipeline] echo'))
+
+    def test_parse_console_only_parallel_blocks_content(self):
+        """Test console-only parsing assigns lines to stages and parallel blocks."""
+        console_log = """[Pipeline] stage (Parallel Test)
+[Pipeline] parallel
+[Pipeline] { (Branch A)
+Testing A
+[Pipeline] }
+[Pipeline] { (Branch B)
+Testing B
+[Pipeline] }
+[Pipeline] // parallel
+[Pipeline] // stage (Parallel Test)"""
+
+        result = self.extractor._parse_console_only(console_log)
+
+        self.assertEqual(len(result), 1)
+        self.assertTrue(result[0]['is_parallel'])
+        blocks = result[0]['parallel_blocks']
+        self.assertEqual([b['block_name'] for b in blocks], ['Branch A', 'Branch B'])
+        self.assertEqual(blocks[0]['log_content'], 'Testing A\n[Pipeline] }\n')
+        self.assertEqual(result[0]['log_content'], '[Pipeline] // stage (Parallel Test)\n')
+
+    def test_parse_console_only_skips_regex_for_plain_lines(self):
+        """Test that only '[Pipeline]' lines are run through the marker regex."""
+        console_log = "[Pipeline] stage (Build)\nline 1\nline 2\n[Pipeline] // stage (Build)"
+
+        with patch.object(JenkinsExtractor, 'PIPELINE_MARKER_PATTERN',
+                          wraps=JenkinsExtractor.PIPELINE_MARKER_PATTERN) as mock_pattern:
+            result = self.extractor._parse_console_only(console_log)
+
+        self.assertEqual(mock_pattern.search.call_count, 2)
+        self.assertEqual(result[0]['log_content'], 'line 1\nline 2\n[Pipeline] // stage (Build)\n')
+
     def test_parse_with_blue_ocean_single_flow(self):
         """Test parsing with Blue Ocean single flow node."""
         console_log = "[Pipeline] stage (Build)\nBuild output\n[Pipeline] // stage"
@@ -8,8 +8,12 @@ multiple Jenkins instance configurations.
 import json
 import os
 import tempfile
+import threading
+import time
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
 import pytest
-from src.jenkins_instance_manager import JenkinsInstance, JenkinsInstanceManager
+from src.jenkins_instance_manager import JenkinsInstance, JenkinsInstanceManager, _normalize_url
 
 
 class TestJenkinsInstance:
@@ -45,6 +49,20 @@ class TestJenkinsInstance:
         assert instance.jenkins_webhook_secret is None
         assert instance.description is None
 
+    def test_jenkins_instance_is_frozen_and_hashable(self):
+        """Test that JenkinsInstance cannot be mutated and can be hashed."""
+        instance = JenkinsInstance(
+            jenkins_url="https://jenkins1.example.com",
+            jenkins_user="admin",
+            jenkins_api_token="token123"
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            instance.jenkins_user = "other"
+
+        same = JenkinsInstance("https://jenkins1.example.com", "admin", "token123")
+        assert len({instance, same}) == 1
+
 
 class TestJenkinsInstanceManager:
     """Tests for JenkinsInstanceManager class."""
@@ -232,6 +250,35 @@ class TestJenkinsInstanceManager:
         )
         assert result is False
 
+    def test_validate_webhook_secret_non_ascii(self, tmp_path):
+        """Test secrets with non-ASCII characters are compared as UTF-8 bytes."""
+        config_file = tmp_path / "jenkins_instances.json"
+        config_file.write_text(json.dumps({
+            "instances": [{
+                "jenkins_url": "https://jenkins1.example.com",
+                "jenkins_user": "admin",
+                "jenkins_api_token": "token",
+                "jenkins_webhook_secret": "sécret-ключ"
+            }]
+        }), encoding='utf-8')
+
+        manager = JenkinsInstanceManager(config_file=str(config_file))
+
+        assert manager.validate_webhook_secret("https://jenkins1.example.com", "sécret-ключ") is True
+        assert manager.validate_webhook_secret("https://jenkins1.example.com", "secret-kljuch") is False
+
+    def test_validate_webhook_secret_uses_compare_digest(self, temp_config_file, valid_config_data):
+        """Test the secret check goes through hmac.compare_digest."""
+        with open(temp_config_file, 'w', encoding='utf-8') as f:
+            json.dump(valid_config_data, f)
+
+        manager = JenkinsInstanceManager(config_file=temp_config_file)
+
+        with patch('src.jenkins_instance_manager.hmac.compare_digest', return_value=True) as mock_compare:
+            assert manager.validate_webhook_secret("https://jenkins1.example.com", "secret1") is True
+
+        mock_compare.assert_called_once_with(b"secret1", b"secret1")
+
     def test_invalid_json_config(self, temp_config_file):
         """Test loading invalid JSON configuration."""
         with open(temp_config_file, 'w', encoding='utf-8') as f:
@@ -392,3 +439,184 @@ class TestJenkinsInstanceManager:
         # Should have decoded the base64 token
         assert instance is not None
         assert instance.jenkins_api_token == original_token
+
+    def test_get_instance_longest_prefix_match(self, temp_config_file):
+        """Test that sub-path URLs resolve to the longest configured base URL."""
+        config_data = {
+            "instances": [
+                {
+                    "jenkins_url": "https://ci.example.com",
+                    "jenkins_user": "root-user",
+                    "jenkins_api_token": "token1"
+                },
+                {
+                    "jenkins_url": "https://ci.example.com/team-a/",
+                    "jenkins_user": "team-a-user",
+                    "jenkins_api_token": "token2"
+                }
+            ]
+        }
+        with open(temp_config_file, 'w', encoding='utf-8') as f:
+            json.dump(config_data, f)
+
+        manager = JenkinsInstanceManager(config_file=temp_config_file)
+
+        assert manager.get_instance("https://ci.example.com/team-a/job/build/42/").jenkins_user == "team-a-user"
+        assert manager.get_instance("https://CI.example.com/team-a").jenkins_user == "team-a-user"
+        assert manager.get_instance("https://ci.example.com/job/build").jenkins_user == "root-user"
+        # Prefixes only match on whole path segments
+        assert manager.get_instance("https://ci.example.com/team-ab/job").jenkins_user == "root-user"
+        assert manager.get_instance("https://ci.example.org/team-a") is None
+
+    def test_get_instance_prefix_does_not_cross_hosts(self, temp_config_file):
+        """Test that a base URL with a path does not match other paths on the same host."""
+        config_data = {
+            "instances": [
+                {
+                    "jenkins_url": "https://ci.example.com/jenkins",
+                    "jenkins_user": "admin",
+                    "jenkins_api_token": "token"
+                }
+            ]
+        }
+        with open(temp_config_file, 'w', encoding='utf-8') as f:
+            json.dump(config_data, f)
+
+        manager = JenkinsInstanceManager(config_file=temp_config_file)
+
+        assert manager.get_instance("https://ci.example.com/jenkins/job/app").jenkins_user == "admin"
+        assert manager.get_instance("https://ci.example.com") is None
+        assert manager.get_instance("https://ci.example.com:8443/jenkins") is None
+
+
+class TestNormalizeUrl:
+    """Tests for the module-level _normalize_url helper."""
+
+    def test_normalize_url_is_memoized(self):
+        """Test that repeated URLs are served from the cache."""
+        _normalize_url.cache_clear()
+
+        assert _normalize_url("HTTPS://Jenkins.Example.com/") == "https://jenkins.example.com"
+        assert _normalize_url("HTTPS://Jenkins.Example.com/") == "https://jenkins.example.com"
+
+        info = _normalize_url.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_manager_method_delegates(self):
+        """Test the manager's _normalize_url matches the module-level helper."""
+        manager = JenkinsInstanceManager(config_file="nonexistent.json")
+        assert manager._normalize_url("http://CI.example.com//") == _normalize_url("http://CI.example.com//")
+
+    def test_normalize_url_canonical_forms(self):
+        """Test that equivalent spellings of an endpoint share one canonical key."""
+        cases = {
+            "HTTPS://Jenkins.Example.Com:443/": "https://jenkins.example.com",
+            "http://jenkins.example.com:80": "http://jenkins.example.com",
+            "http://jenkins.example.com:8080/": "http://jenkins.example.com:8080",
+            "https://ci.example.com/Jenkins/?token=x#top": "https://ci.example.com/Jenkins",
+            "https://bücher.example/": "https://xn--bcher-kva.example",
+            "http://[::1]:8080/": "http://[::1]:8080",
+            "https://user@CI.example.com/": "https://user@ci.example.com",
+            "  https://ci.example.com/  ": "https://ci.example.com",
+            "Jenkins.Example.com/": "jenkins.example.com",
+        }
+        for url, expected in cases.items():
+            assert _normalize_url(url) == expected, url
+
+    def test_default_port_matches_configured_url(self, tmp_path):
+        """Test that a webhook URL with an explicit default port finds the instance."""
+        config_file = tmp_path / "jenkins_instances.json"
+        config_file.write_text(json.dumps({
+            "instances": [{
+                "jenkins_url": "https://Jenkins.Example.com",
+                "jenkins_user": "admin",
+                "jenkins_api_token": "token"
+            }]
+        }), encoding='utf-8')
+
+        manager = JenkinsInstanceManager(config_file=str(config_file))
+
+        assert manager.get_instance("https://jenkins.example.com:443/").jenkins_user == "admin"
+        assert manager.get_instance("https://jenkins.example.com/?delay=0sec").jenkins_user == "admin"
+        assert manager.get_instance("https://jenkins.example.com:8443/") is None
+
+
+class TestJenkinsInstanceManagerReload:
+    """Tests for JenkinsInstanceManager.reload()."""
+
+    @staticmethod
+    def _write_config(path, user):
+        path.write_text(json.dumps({
+            "instances": [{
+                "jenkins_url": "https://jenkins1.example.com",
+                "jenkins_user": user,
+                "jenkins_api_token": "token"
+            }]
+        }), encoding='utf-8')
+
+    def test_reload_picks_up_changes(self, tmp_path):
+        """Test that reload replaces instances with the file's current contents."""
+        config_file = tmp_path / "jenkins_instances.json"
+        self._write_config(config_file, "before")
+        manager = JenkinsInstanceManager(config_file=str(config_file))
+
+        self._write_config(config_file, "after")
+
+        assert manager.reload() == 1
+        assert manager.get_instance("https://jenkins1.example.com").jenkins_user == "after"
+
+    def test_reload_invalid_file_keeps_previous_instances(self, tmp_path):
+        """Test that a failed reload leaves the loaded instances untouched."""
+        config_file = tmp_path / "jenkins_instances.json"
+        self._write_config(config_file, "before")
+        manager = JenkinsInstanceManager(config_file=str(config_file))
+
+        config_file.write_text('{"instances": [{"jenkins_url": "https://x.example.com"}]}', encoding='utf-8')
+
+        with pytest.raises(ValueError):
+            manager.reload()
+        assert manager.get_instance("https://jenkins1.example.com").jenkins_user == "before"
+        assert manager.get_instance("https://x.example.com") is None
+
+    def test_reload_after_file_removed_drops_instances(self, tmp_path):
+        """Test that removing the file clears exact and sub-path lookups."""
+        config_file = tmp_path / "jenkins_instances.json"
+        self._write_config(config_file, "before")
+        manager = JenkinsInstanceManager(config_file=str(config_file))
+
+        config_file.unlink()
+
+        assert manager.reload() == 0
+        assert not manager.has_instances()
+        assert manager.get_instance("https://jenkins1.example.com") is None
+        assert manager.get_instance("https://jenkins1.example.com/job/app/1") is None
+
+    def test_concurrent_reloads_share_one_parse(self, tmp_path, monkeypatch):
+        """Test that reloads arriving while one is in flight wait for it instead of parsing."""
+        config_file = tmp_path / "jenkins_instances.json"
+        self._write_config(config_file, "admin")
+        manager = JenkinsInstanceManager(config_file=str(config_file))
+
+        release = threading.Event()
+        calls = []
+        original_load = manager._load_instances
+
+        def slow_load():
+            calls.append(1)
+            release.wait(5)
+            original_load()
+
+        monkeypatch.setattr(manager, '_load_instances', slow_load)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(manager.reload())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [1] * 5
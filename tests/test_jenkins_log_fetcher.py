@@ -2,13 +2,15 @@
 Unit tests for jenkins_log_fetcher module.
 """
 
+import io
+import threading
 import unittest
 from unittest.mock import Mock, patch
 import requests
 
 from src.jenkins_log_fetcher import JenkinsLogFetcher
 from src.config_loader import Config
-from src.error_handler import RetryExhaustedError
+from src.error_handler import ErrorHandler, RetryExhaustedError
 
 
 class TestJenkinsLogFetcher(unittest.TestCase):
@@ -156,7 +158,7 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         }
 
         # Mock the error_handler.retry_with_backoff to return the response
-        with patch.object(self.fetcher.error_handler, 'retry_with_backoff', return_value=mock_response):
+        with patch.object(ErrorHandler, 'retry_with_backoff', return_value=mock_response):
             result = self.fetcher.fetch_build_info("test-job", 123)
 
         self.assertEqual(result["result"], "SUCCESS")
@@ -167,7 +169,7 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         """Test build info fetch when retries are exhausted."""
         # Mock the error_handler.retry_with_backoff to raise RetryExhaustedError
         test_exception = Exception("Max retries exceeded")
-        with patch.object(self.fetcher.error_handler, 'retry_with_backoff',
+        with patch.object(ErrorHandler, 'retry_with_backoff',
                           side_effect=RetryExhaustedError(3, test_exception)):
             with self.assertRaises(RetryExhaustedError):
                 self.fetcher.fetch_build_info("test-job", 123)
@@ -176,18 +178,57 @@ class TestJenkinsLogFetcher(unittest.TestCase):
     def test_fetch_console_log_success(self, mock_make_request):
         """Test successful console log fetch."""
         mock_response = Mock()
-        mock_response.text = "Console log output\nLine 2\nLine 3"
+        mock_response.encoding = 'utf-8'
+        mock_response.iter_content.return_value = iter(["Console log output\nLi", "ne 2\nLine 3"])
 
-        with patch.object(self.fetcher.error_handler, 'retry_with_backoff', return_value=mock_response):
+        with patch.object(ErrorHandler, 'retry_with_backoff', return_value=mock_response):
             result = self.fetcher.fetch_console_log("test-job", 123)
 
         self.assertEqual(result, "Console log output\nLine 2\nLine 3")
+        mock_response.close.assert_called_once()
+
+    @patch('requests.Session.request')
+    def test_fetch_console_log_to_streams_into_sink(self, mock_request):
+        """Test fetch_console_log_to writes decoded chunks to the sink as they arrive."""
+        mock_response = Mock()
+        mock_response.encoding = None
+        mock_response.iter_content.return_value = iter(["first chunk\n", "second chunk\n"])
+        mock_request.return_value = mock_response
+        sink = io.StringIO()
+
+        written = self.fetcher.fetch_console_log_to("test-job", 123, sink)
+
+        self.assertEqual(sink.getvalue(), "first chunk\nsecond chunk\n")
+        self.assertEqual(written, len("first chunk\nsecond chunk\n"))
+        self.assertTrue(mock_request.call_args[1]['stream'])
+        self.assertEqual(mock_response.encoding, 'utf-8')
+        mock_response.iter_content.assert_called_once_with(chunk_size=64 * 1024, decode_unicode=True)
+
+    @patch('requests.Session.request')
+    def test_fetch_console_log_to_does_not_retry_mid_stream(self, mock_request):
+        """Test a failure after chunks were written is raised, not retried."""
+        def broken_stream(**kwargs):
+            yield "partial\n"
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        mock_response = Mock()
+        mock_response.encoding = 'utf-8'
+        mock_response.iter_content.side_effect = broken_stream
+        mock_request.return_value = mock_response
+        sink = io.StringIO()
+
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            self.fetcher.fetch_console_log_to("test-job", 123, sink)
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(sink.getvalue(), "partial\n")
+        mock_response.close.assert_called_once()
 
     @patch('src.jenkins_log_fetcher.JenkinsLogFetcher._make_request')
     def test_fetch_console_log_retry_exhausted(self, mock_make_request):
         """Test console log fetch when retries are exhausted."""
         test_exception = Exception("Max retries exceeded")
-        with patch.object(self.fetcher.error_handler, 'retry_with_backoff',
+        with patch.object(ErrorHandler, 'retry_with_backoff',
                           side_effect=RetryExhaustedError(3, test_exception)):
             with self.assertRaises(RetryExhaustedError):
                 self.fetcher.fetch_console_log("test-job", 123)
@@ -279,6 +320,46 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         # Should return None when JSON doesn't have text field
         self.assertIsNone(result)
 
+    @patch('src.jenkins_log_fetcher.JenkinsLogFetcher.fetch_stage_log')
+    def test_fetch_all_stage_logs(self, mock_fetch_stage_log):
+        """Test fetch_all_stage_logs returns each stage's log keyed by stage ID."""
+        mock_fetch_stage_log.side_effect = lambda job, build, stage_id: None if stage_id == '3' else f"log {stage_id}"
+
+        result = self.fetcher.fetch_all_stage_logs("test-job", 123, ['1', '2', '3'])
+
+        self.assertEqual(result, {'1': 'log 1', '2': 'log 2', '3': None})
+        self.assertEqual(mock_fetch_stage_log.call_count, 3)
+
+    @patch('src.jenkins_log_fetcher.JenkinsLogFetcher.fetch_stage_log')
+    def test_fetch_all_stage_logs_runs_concurrently(self, mock_fetch_stage_log):
+        """Test stage logs are fetched in parallel rather than one after another."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fetch(job, build, stage_id):
+            barrier.wait()  # Only passes if all four fetches are in flight at once
+            return stage_id
+
+        mock_fetch_stage_log.side_effect = fetch
+
+        result = self.fetcher.fetch_all_stage_logs("test-job", 123, ['a', 'b', 'c', 'd'])
+
+        self.assertEqual(result, {'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'})
+
+    @patch('src.jenkins_log_fetcher.JenkinsLogFetcher.fetch_stage_log_tail')
+    def test_fetch_all_stage_logs_with_tail_lines(self, mock_fetch_tail):
+        """Test fetch_all_stage_logs trims each log via fetch_stage_log_tail when tail_lines is set."""
+        mock_fetch_tail.side_effect = lambda job, build, stage_id, tail_lines: f"tail {stage_id}"
+
+        result = self.fetcher.fetch_all_stage_logs("test-job", 123, ['1', '2'], tail_lines=50)
+
+        self.assertEqual(result, {'1': 'tail 1', '2': 'tail 2'})
+        mock_fetch_tail.assert_any_call("test-job", 123, '1', 50)
+        mock_fetch_tail.assert_any_call("test-job", 123, '2', 50)
+
+    def test_fetch_all_stage_logs_empty(self):
+        """Test fetch_all_stage_logs with no stage IDs."""
+        self.assertEqual(self.fetcher.fetch_all_stage_logs("test-job", 123, []), {})
+
     @patch('src.jenkins_log_fetcher.JenkinsLogFetcher.fetch_stage_log')
     def test_fetch_stage_log_tail_success(self, mock_fetch_stage_log):
         """Test fetch_stage_log_tail with successful stage log fetch."""
@@ -354,7 +435,40 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         # Should return full log since it's less than 5000 lines
         self.assertEqual(result, "Line 1\nLine 2\nLine 3\nLine 4\nLine 5")
 
-    @patch('requests.request')
+    def test_session_configured_for_keep_alive(self):
+        """Test the fetcher holds an authenticated session with pooled adapters."""
+        self.assertIsInstance(self.fetcher.session, requests.Session)
+        self.assertIs(self.fetcher.session.auth, self.fetcher.auth)
+
+        adapter = self.fetcher.session.get_adapter('https://jenkins1.example.com/job/x')
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertEqual(adapter.max_retries.total, 0)
+
+    @patch('requests.Session.close')
+    def test_close_closes_session(self, mock_close):
+        """Test close() releases the pooled session."""
+        self.fetcher.close()
+        mock_close.assert_called_once()
+
+    @patch('requests.Session.close')
+    def test_context_manager_closes_session(self, mock_close):
+        """Test the fetcher closes its session when used as a context manager."""
+        with self.fetcher as fetcher:
+            self.assertIs(fetcher, self.fetcher)
+        mock_close.assert_called_once()
+
+    @patch('requests.Session.request')
+    def test_make_request_reuses_session(self, mock_request):
+        """Test consecutive requests go through the same session without per-call auth."""
+        mock_request.return_value = Mock(status_code=200)
+
+        self.fetcher._make_request('GET', 'https://jenkins1.example.com/a')
+        self.fetcher._make_request('GET', 'https://jenkins1.example.com/b')
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertNotIn('auth', mock_request.call_args[1])
+
+    @patch('requests.Session.request')
     def test_make_request_success(self, mock_request):
         """Test _make_request with successful response."""
         mock_response = Mock()
@@ -366,7 +480,7 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         self.assertEqual(result.status_code, 200)
         mock_request.assert_called_once()
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_make_request_with_custom_timeout(self, mock_request):
         """Test _make_request with custom timeout."""
         mock_response = Mock()
@@ -379,7 +493,7 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         call_kwargs = mock_request.call_args[1]
         self.assertEqual(call_kwargs['timeout'], 60)
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_make_request_raises_http_error(self, mock_request):
         """Test _make_request when HTTP error occurs."""
         mock_response = Mock()
@@ -391,8 +505,8 @@ class TestJenkinsLogFetcher(unittest.TestCase):
             result = self.fetcher._make_request('GET', 'https://jenkins1.example.com/api/json')
             result.raise_for_status()
 
-    @patch('requests.head')
-    @patch('requests.get')
+    @patch('requests.Session.head')
+    @patch('requests.Session.get')
     def test_fetch_console_log_tail_success(self, mock_get, mock_head):
         """Test fetch_console_log_tail with successful response."""
         # Mock HEAD request to get content length
@@ -412,8 +526,11 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         self.assertIn("Error occurred", result)
         mock_head.assert_called_once()
         mock_get.assert_called_once()
+        # Range offsets are computed on the raw log, so the tail must not be gzip encoded
+        self.assertEqual(mock_head.call_args[1]['headers']['Accept-Encoding'], 'identity')
+        self.assertEqual(mock_get.call_args[1]['headers']['Accept-Encoding'], 'identity')
 
-    @patch('requests.head')
+    @patch('requests.Session.head')
     def test_fetch_console_log_tail_empty_log(self, mock_head):
         """Test fetch_console_log_tail when log is empty."""
         mock_head_response = Mock()
@@ -424,7 +541,7 @@ class TestJenkinsLogFetcher(unittest.TestCase):
 
         self.assertEqual(result, "")
 
-    @patch('requests.head')
+    @patch('requests.Session.head')
     def test_fetch_console_log_tail_failure(self, mock_head):
         """Test fetch_console_log_tail when request fails."""
         mock_head.side_effect = requests.exceptions.RequestException("Connection error")
@@ -432,7 +549,7 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         with self.assertRaises(requests.exceptions.RequestException):
             self.fetcher.fetch_console_log_tail("test-job", 123)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_console_log_streaming_success(self, mock_get):
         """Test fetch_console_log_streaming with successful response."""
         # Mock streaming response
@@ -456,7 +573,7 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         self.assertFalse(result['truncated'])
         self.assertIn("Error: Something failed", result['log_content'])
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_console_log_streaming_truncated(self, mock_get):
         """Test fetch_console_log_streaming with truncation at max_lines."""
         # Mock streaming response with many lines
@@ -471,7 +588,7 @@ class TestJenkinsLogFetcher(unittest.TestCase):
         self.assertTrue(result['truncated'])
         self.assertEqual(result['total_lines'], 100)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_console_log_streaming_failure(self, mock_get):
         """Test fetch_console_log_streaming when request fails."""
         mock_get.side_effect = requests.exceptions.RequestException("Connection error")
@@ -60,7 +60,7 @@ class TestInitApp(unittest.TestCase):
 
         # Verify all components were initialized
         mock_config_loader.load.assert_called_once()
-        mock_config_loader.validate.assert_called_once_with(mock_config)
+        mock_config_loader.validate.assert_not_called()
         mock_setup_logging.assert_called_once_with(log_dir=temp_dir, log_level="INFO")
         mock_pipeline_extractor.assert_called_once()
         mock_log_fetcher.assert_called_once_with(mock_config)
@@ -181,6 +181,75 @@ class TestInitApp(unittest.TestCase):
         mock_jenkins_extractor.assert_called_once()
         mock_jenkins_log_fetcher.assert_called_once_with(mock_config)
 
+    @patch('src.webhook_listener.JenkinsInstanceManager')
+    @patch('src.webhook_listener.PipelineMonitor')
+    @patch('src.webhook_listener.StorageManager')
+    @patch('src.webhook_listener.LogFetcher')
+    @patch('src.webhook_listener.PipelineExtractor')
+    @patch('src.webhook_listener.setup_logging')
+    @patch('src.webhook_listener.ConfigLoader')
+    def test_init_app_reloads_existing_instance_manager(self, mock_config_loader, mock_setup_logging,
+                                                        mock_pipeline_extractor, mock_log_fetcher,
+                                                        mock_storage_manager, mock_monitor,
+                                                        mock_instance_manager_cls):
+        """Test re-initialization reloads jenkins_instances.json on the existing manager."""
+        from src.webhook_listener import init_app
+
+        mock_config = MagicMock()
+        mock_config.log_output_dir = tempfile.mkdtemp()
+        mock_config.log_level = "INFO"
+        mock_config.bfa_host = None
+        mock_config.bfa_secret_key = None
+        mock_config.api_post_enabled = False
+        mock_config.jenkins_enabled = False
+        mock_config_loader.load.return_value = mock_config
+
+        existing_manager = MagicMock()
+        existing_manager.has_instances.return_value = False
+
+        with patch('src.webhook_listener.jenkins_instance_manager', existing_manager):
+            init_app()
+
+            from src import webhook_listener
+            self.assertIs(webhook_listener.jenkins_instance_manager, existing_manager)
+
+        existing_manager.reload.assert_called_once_with()
+        mock_instance_manager_cls.assert_not_called()
+
+    @patch('src.webhook_listener.JenkinsLogFetcher')
+    @patch('src.webhook_listener.JenkinsExtractor')
+    @patch('src.webhook_listener.PipelineMonitor')
+    @patch('src.webhook_listener.StorageManager')
+    @patch('src.webhook_listener.LogFetcher')
+    @patch('src.webhook_listener.PipelineExtractor')
+    @patch('src.webhook_listener.setup_logging')
+    @patch('src.webhook_listener.ConfigLoader')
+    def test_init_app_closes_previous_jenkins_fetcher(self, mock_config_loader, mock_setup_logging,
+                                                      mock_pipeline_extractor, mock_log_fetcher,
+                                                      mock_storage_manager, mock_monitor,
+                                                      mock_jenkins_extractor, mock_jenkins_log_fetcher):
+        """Test re-initialization closes the session of the previous default Jenkins fetcher."""
+        from src.webhook_listener import init_app
+
+        mock_config = MagicMock()
+        mock_config.log_output_dir = tempfile.mkdtemp()
+        mock_config.log_level = "INFO"
+        mock_config.bfa_host = None
+        mock_config.bfa_secret_key = None
+        mock_config.api_post_enabled = False
+        mock_config.jenkins_enabled = True
+        mock_config_loader.load.return_value = mock_config
+
+        previous_fetcher = MagicMock()
+
+        with patch('src.webhook_listener.jenkins_log_fetcher', previous_fetcher):
+            init_app()
+
+            from src import webhook_listener
+            self.assertIs(webhook_listener.jenkins_log_fetcher, mock_jenkins_log_fetcher.return_value)
+
+        previous_fetcher.close.assert_called_once()
+
     @patch('src.webhook_listener.sys.exit')
     @patch('src.webhook_listener.ConfigLoader')
     def test_init_app_config_load_failure(self, mock_config_loader, mock_exit):
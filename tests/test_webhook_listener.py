@@ -2,6 +2,7 @@
 Unit tests for webhook_listener module.
 """
 
+import tempfile
 import unittest
 from unittest.mock import patch, Mock
 
@@ -1721,5 +1722,149 @@ Build completed with errors"""
         self.assertNotIn('Full console log content', log_content)
 
 
+class TestPrefetchStageLogs(unittest.TestCase):
+    """Test cases for fetching several failed stage logs concurrently."""
+
+    def setUp(self):
+        """Set up two failed stages and the config they are processed with."""
+        self.blue_ocean_stages = [
+            {'name': 'Build', 'id': 'stage-1', 'status': 'FAILED'},
+            {'name': 'Test', 'id': 'stage-2', 'status': 'FAILED'},
+        ]
+        patcher = patch('src.webhook_listener.config')
+        self.mock_config = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_config.error_context_lines_before = 50
+        self.mock_config.error_context_lines_after = 10
+        self.mock_config.error_adaptive_context_enabled = False
+        self.mock_config.error_adaptive_thresholds = []
+        self.mock_config.jenkins_filter_handled_failures = False
+        self.mock_config.tail_log_lines = 5000
+        self.mock_config.log_output_dir = tempfile.gettempdir()
+
+    def test_failed_stages_fetched_in_one_batch(self):
+        """Test multiple failed stages use fetch_all_stage_logs instead of per-stage fetches."""
+        from src.webhook_listener import _extract_failed_stages_with_logs
+
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_all_stage_logs.return_value = {
+            'stage-1': 'Error: build broke',
+            'stage-2': None,
+        }
+
+        result = _extract_failed_stages_with_logs(
+            self.blue_ocean_stages, "Console log", mock_fetcher, "test-job", 123
+        )
+
+        mock_fetcher.fetch_all_stage_logs.assert_called_once_with(
+            "test-job", 123, ['stage-1', 'stage-2'], tail_lines=5000
+        )
+        mock_fetcher.fetch_stage_log_tail.assert_not_called()
+        self.assertEqual(result[0]['stage_full_log'], 'Error: build broke')
+        self.assertNotIn('stage_full_log', result[1])
+
+    def test_falls_back_to_per_stage_fetch_when_batch_fails(self):
+        """Test a failing batch fetch falls back to fetching each stage on its own."""
+        from src.webhook_listener import _extract_failed_stages_with_logs
+
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_all_stage_logs.side_effect = Exception("pool error")
+        mock_fetcher.fetch_stage_log_tail.return_value = 'Error: build broke'
+
+        result = _extract_failed_stages_with_logs(
+            self.blue_ocean_stages, "Console log", mock_fetcher, "test-job", 123
+        )
+
+        self.assertEqual(mock_fetcher.fetch_stage_log_tail.call_count, 2)
+        self.assertEqual([stage['stage_full_log'] for stage in result], ['Error: build broke'] * 2)
+
+    def test_single_stage_skips_batch(self):
+        """Test a single failed stage is fetched directly without the thread pool."""
+        from src.webhook_listener import _prefetch_stage_logs
+
+        mock_fetcher = Mock()
+        failed_stages = [{'stage_name': 'Build', 'stage_id': 'stage-1'}]
+
+        self.assertEqual(_prefetch_stage_logs(mock_fetcher, "test-job", 123, failed_stages), {})
+        mock_fetcher.fetch_all_stage_logs.assert_not_called()
+
+
+class TestJenkinsInstanceFetcherCache(unittest.TestCase):
+    """Test cases for reusing per-instance Jenkins fetchers across builds."""
+
+    def setUp(self):
+        """Start every test with an empty fetcher cache."""
+        from src.webhook_listener import _close_jenkins_fetchers
+        _close_jenkins_fetchers()
+        self.addCleanup(_close_jenkins_fetchers)
+
+    @staticmethod
+    def _instance(token='token1'):
+        from src.jenkins_instance_manager import JenkinsInstance
+        return JenkinsInstance(
+            jenkins_url='https://jenkins2.example.com',
+            jenkins_user='user',
+            jenkins_api_token=token
+        )
+
+    @patch('src.webhook_listener.JenkinsLogFetcher')
+    @patch('src.webhook_listener.config')
+    def test_fetcher_reused_for_same_instance(self, mock_config, mock_fetcher_cls):
+        """Test repeated builds for one instance share a single fetcher."""
+        from src.webhook_listener import _get_instance_fetcher
+
+        first = _get_instance_fetcher(self._instance())
+        second = _get_instance_fetcher(self._instance())
+
+        self.assertIs(first, second)
+        mock_fetcher_cls.assert_called_once()
+        first.close.assert_not_called()
+
+    @patch('src.webhook_listener.JenkinsLogFetcher')
+    @patch('src.webhook_listener.config')
+    def test_fetcher_replaced_when_credentials_change(self, mock_config, mock_fetcher_cls):
+        """Test a changed instance gets a new fetcher; the stale one is dropped, not closed."""
+        from src.webhook_listener import _get_instance_fetcher
+
+        mock_fetcher_cls.side_effect = [Mock(), Mock()]
+        old = _get_instance_fetcher(self._instance('token1'))
+        new = _get_instance_fetcher(self._instance('token2'))
+
+        self.assertIsNot(old, new)
+        self.assertIs(_get_instance_fetcher(self._instance('token2')), new)
+        # A build still running on the old fetcher must not have its session closed under it
+        old.close.assert_not_called()
+
+    @patch('src.webhook_listener.JenkinsLogFetcher')
+    @patch('src.webhook_listener.config')
+    def test_fetcher_replaced_when_retry_settings_change(self, mock_config, mock_fetcher_cls):
+        """Test a fetcher is rebuilt when only the retry configuration changes."""
+        from src.webhook_listener import _get_instance_fetcher
+
+        mock_fetcher_cls.side_effect = [Mock(), Mock()]
+        mock_config.retry_attempts = 3
+        mock_config.retry_delay = 2
+        old = _get_instance_fetcher(self._instance())
+
+        mock_config.retry_attempts = 5
+        new = _get_instance_fetcher(self._instance())
+
+        self.assertIsNot(old, new)
+        self.assertEqual(mock_fetcher_cls.call_args[1]['retry_attempts'], 5)
+
+    @patch('src.webhook_listener.JenkinsLogFetcher')
+    @patch('src.webhook_listener.config')
+    def test_close_jenkins_fetchers_closes_sessions(self, mock_config, mock_fetcher_cls):
+        """Test cached fetchers are closed and dropped on shutdown."""
+        from src.webhook_listener import _get_instance_fetcher, _close_jenkins_fetchers
+
+        mock_fetcher_cls.side_effect = [Mock(), Mock()]
+        fetcher = _get_instance_fetcher(self._instance())
+        _close_jenkins_fetchers()
+
+        fetcher.close.assert_called_once()
+        self.assertIsNot(_get_instance_fetcher(self._instance()), fetcher)
+
+
 if __name__ == "__main__":
     unittest.main()